@@ -5,6 +5,7 @@ import json
 import os
 import random
 import re
+import time
 import uuid
 from collections import defaultdict
 from datetime import datetime, timedelta
@@ -14,13 +15,30 @@ from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 import httpx
 import joblib
 import numpy as np
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field, EmailStr
 from bson import ObjectId
+from pymongo import ReturnDocument
 
+from campus_gazetteer import DEFAULT_CAMPUS_PLACES, CampusGazetteer
+from catalog_loader import CatalogWatcher, iter_catalog_sellers
+from circuit_breaker import CircuitBreaker
 from feature_encoder import FeatureEncoder
+from geo_index import SpatialGridIndex, coerce_lat_lng, haversine_meters, walking_minutes
+from http_cache import etag_matches, make_etag, not_modified, set_cache_headers
+from job_queue import JobQueue
+from listings_index import ListingsIndex, normalize_category, tokenize_search_text
+from lsh_index import MinHashLSHIndex
+from micro_batch import MicroBatcher
+from parse_cache import ParseCache, parse_cache_key
+from percolator import RequestPercolator
+from pooled_http import PooledHTTPClient
+from single_flight import SingleFlight
+from profile_records import SellerRecord
+from query_cache import TTLCache
+from seller_pool import PoolEntry, SellerPool
 from database import connect_db, close_db, get_db
 from models import (
     UserSchema, UserCreate, UserResponse, SellerProfileSchema,
@@ -37,6 +55,109 @@ CAMPUS_SELLERS_PATH = ROOT_DIR / "campus_sellers.json"
 
 GEMINI_SERVICE_URL = os.getenv("GEMINI_SERVICE_URL", "http://127.0.0.1:3001")
 
+# One pooled, keep-alive client is shared by every call to the parser service.
+# GEMINI_HTTP2 enables HTTP/2 when the optional h2 package is installed.
+GEMINI_TIMEOUT_SECONDS = float(os.getenv("GEMINI_TIMEOUT_SECONDS", "60"))
+GEMINI_CONNECT_TIMEOUT_SECONDS = float(os.getenv("GEMINI_CONNECT_TIMEOUT_SECONDS", "5"))
+GEMINI_MAX_CONNECTIONS = int(os.getenv("GEMINI_MAX_CONNECTIONS", "20"))
+GEMINI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("GEMINI_MAX_KEEPALIVE_CONNECTIONS", "10"))
+GEMINI_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("GEMINI_KEEPALIVE_EXPIRY_SECONDS", "30"))
+GEMINI_HTTP2 = os.getenv("GEMINI_HTTP2", "true").lower() in ("1", "true", "yes")
+
+# Circuit breaker around the parser service: it opens when at least
+# GEMINI_BREAKER_FAILURE_RATIO of the last GEMINI_BREAKER_WINDOW calls failed or
+# took GEMINI_SLOW_CALL_SECONDS or longer, and retries after
+# GEMINI_BREAKER_OPEN_SECONDS.  Flash requests wait at most
+# GEMINI_FLASH_REQUEST_TIMEOUT_SECONDS before the local fallback parser is used.
+GEMINI_BREAKER_WINDOW = int(os.getenv("GEMINI_BREAKER_WINDOW", "20"))
+GEMINI_BREAKER_MIN_CALLS = int(os.getenv("GEMINI_BREAKER_MIN_CALLS", "5"))
+GEMINI_BREAKER_FAILURE_RATIO = float(os.getenv("GEMINI_BREAKER_FAILURE_RATIO", "0.5"))
+GEMINI_SLOW_CALL_SECONDS = float(os.getenv("GEMINI_SLOW_CALL_SECONDS", "8"))
+GEMINI_BREAKER_OPEN_SECONDS = float(os.getenv("GEMINI_BREAKER_OPEN_SECONDS", "30"))
+GEMINI_FLASH_REQUEST_TIMEOUT_SECONDS = float(os.getenv("GEMINI_FLASH_REQUEST_TIMEOUT_SECONDS", "15"))
+
+# Profile parses are sent to the parser's batch route, up to
+# GEMINI_BATCH_MAX_SIZE at a time after waiting at most GEMINI_BATCH_WAIT_MS
+# for company; a size of 1 sends every profile on its own.  The size is capped
+# at the batch route's own limit (MAX_BATCH_ITEMS in json-parsing-gemini),
+# which rejects larger batches with 413.
+GEMINI_BATCH_ROUTE_LIMIT = 32
+GEMINI_BATCH_MAX_SIZE = int(os.getenv("GEMINI_BATCH_MAX_SIZE", "16"))
+if GEMINI_BATCH_MAX_SIZE > GEMINI_BATCH_ROUTE_LIMIT:
+    print(
+        f"[WARNING] GEMINI_BATCH_MAX_SIZE={GEMINI_BATCH_MAX_SIZE} exceeds the parser's batch limit; "
+        f"using {GEMINI_BATCH_ROUTE_LIMIT}"
+    )
+    GEMINI_BATCH_MAX_SIZE = GEMINI_BATCH_ROUTE_LIMIT
+GEMINI_BATCH_WAIT_MS = float(os.getenv("GEMINI_BATCH_WAIT_MS", "20"))
+
+# Seller profiles for new registrations are generated by background workers.
+PROFILE_JOB_CONCURRENCY = int(os.getenv("PROFILE_JOB_CONCURRENCY", "4"))
+PROFILE_JOB_MAX_QUEUED = int(os.getenv("PROFILE_JOB_MAX_QUEUED", "200"))
+PROFILE_JOB_MAX_ATTEMPTS = int(os.getenv("PROFILE_JOB_MAX_ATTEMPTS", "3"))
+PROFILE_JOB_RETRY_SECONDS = float(os.getenv("PROFILE_JOB_RETRY_SECONDS", "2"))
+
+# Parser results are cached by a hash of endpoint, normalized text and the
+# other payload fields.  PARSE_CACHE_DIR (unset by default) adds an on-disk
+# tier that survives restarts.
+PARSE_CACHE_SIZE = int(os.getenv("PARSE_CACHE_SIZE", "1024"))
+PARSE_CACHE_TTL_SECONDS = float(os.getenv("PARSE_CACHE_TTL_SECONDS", "86400"))
+PARSE_CACHE_DIR = os.getenv("PARSE_CACHE_DIR")
+
+# Approximate nearest-neighbour retrieval over seller text.  Pools larger than
+# LSH_PREFILTER_MIN_POOL only score the LSH candidates; LSH_PROBE_BANDS trades
+# recall (more bands) for speed (fewer bands).  With LSH_BANDS bands of
+# LSH_ROWS rows, texts start becoming candidates around a character-trigram
+# Jaccard similarity of (1 / LSH_BANDS) ** (1 / LSH_ROWS), ~0.47 by default.
+LSH_BANDS = int(os.getenv("LSH_BANDS", "20"))
+LSH_ROWS = int(os.getenv("LSH_ROWS", "4"))
+LSH_PROBE_BANDS = int(os.getenv("LSH_PROBE_BANDS", str(LSH_BANDS)))
+LSH_TOP_N = int(os.getenv("LSH_TOP_N", "200"))
+LSH_PREFILTER_MIN_POOL = int(os.getenv("LSH_PREFILTER_MIN_POOL", "1000"))
+
+# Sellers with GPS coordinates are kept in a spatial grid.  When a request has
+# coordinates and a radius (request metadata ``radiusMeters`` or the default
+# below; 0 disables it), only located sellers inside the radius are scored.
+GEO_GRID_CELL_METERS = float(os.getenv("GEO_GRID_CELL_METERS", "250"))
+MATCH_RADIUS_METERS = float(os.getenv("MATCH_RADIUS_METERS", "0"))
+
+# Campus location strings are resolved to gazetteer places laid out around
+# this centre; sellers without GPS fall back to their place's coordinates.
+CAMPUS_CENTER_LAT = float(os.getenv("CAMPUS_CENTER_LAT", "34.0689"))
+CAMPUS_CENTER_LNG = float(os.getenv("CAMPUS_CENTER_LNG", "-118.4452"))
+
+# /api/listings returns pages of LISTINGS_PAGE_SIZE listings by default; the
+# ``limit`` query parameter is capped at LISTINGS_MAX_PAGE_SIZE.
+LISTINGS_PAGE_SIZE = int(os.getenv("LISTINGS_PAGE_SIZE", "50"))
+LISTINGS_MAX_PAGE_SIZE = int(os.getenv("LISTINGS_MAX_PAGE_SIZE", "200"))
+
+# How often the background watcher checks campus_sellers.json for changes.
+CATALOG_POLL_SECONDS = float(os.getenv("CATALOG_POLL_SECONDS", "2"))
+
+# LRU cache of /api/listings results, keyed on the normalized query and the
+# catalog generation.
+LISTINGS_QUERY_CACHE_SIZE = int(os.getenv("LISTINGS_QUERY_CACHE_SIZE", "256"))
+LISTINGS_QUERY_CACHE_TTL_SECONDS = float(os.getenv("LISTINGS_QUERY_CACHE_TTL_SECONDS", "60"))
+AUTOCOMPLETE_MAX_SUGGESTIONS = int(os.getenv("AUTOCOMPLETE_MAX_SUGGESTIONS", "20"))
+
+# Open flash requests stay in a percolator index; new sellers scoring at least
+# STANDING_MATCH_MIN_LIKELIHOOD (percent) and new listings within the price
+# ceiling are recorded as alerts, keeping the latest STANDING_ALERTS_MAX.
+STANDING_MATCH_MIN_LIKELIHOOD = float(os.getenv("STANDING_MATCH_MIN_LIKELIHOOD", "50"))
+STANDING_ALERTS_MAX = int(os.getenv("STANDING_ALERTS_MAX", "50"))
+
+# Catalog reads carry strong ETags and honour If-None-Match.  Listings and
+# profile history may be served from a shared cache for the max-ages below;
+# the profile list changes with every seed, so caches must revalidate it.
+LISTINGS_CACHE_MAX_AGE = int(os.getenv("LISTINGS_CACHE_MAX_AGE", "30"))
+PROFILE_HISTORY_CACHE_MAX_AGE = int(os.getenv("PROFILE_HISTORY_CACHE_MAX_AGE", "300"))
+LISTINGS_CACHE_CONTROL = f"public, max-age={LISTINGS_CACHE_MAX_AGE}"
+PROFILES_CACHE_CONTROL = "public, no-cache"
+PROFILE_HISTORY_CACHE_CONTROL = f"public, max-age={PROFILE_HISTORY_CACHE_MAX_AGE}"
+# The seller pool lives in memory and its generation counter restarts with
+# each process, so profile ETags also name the process that built the pool.
+SELLER_POOL_BOOT_ID = uuid.uuid4().hex
+
 if not MODEL_PATH.exists():
     raise RuntimeError(f"Expected to find model artefact at {MODEL_PATH}")
 
@@ -47,6 +168,10 @@ with open(COLUMNS_PATH, "r", encoding="utf-8") as fh:
 encoder = FeatureEncoder(model_columns)
 positive_class_index = int(np.where(model.classes_ == 1)[0][0]) if hasattr(model, "classes_") else 1
 
+campus_gazetteer = CampusGazetteer(
+    DEFAULT_CAMPUS_PLACES, center=(CAMPUS_CENTER_LAT, CAMPUS_CENTER_LNG)
+)
+
 DEMO_SELLER_PROFILES: List[Dict[str, Any]] = [
     {
         "user_id": "sustainable_style_aisha",
@@ -1299,6 +1424,9 @@ DEMO_PROFILE_HISTORY: Dict[str, List[Dict[str, Any]]] = {
     ],
 }
 
+# The demo history is static, so its ETags are keyed on a digest of the data.
+PROFILE_HISTORY_VERSION = make_etag(DEMO_PROFILE_HISTORY)
+
 
 WORD_RE = re.compile(r"[A-Za-z0-9']+")
 
@@ -1461,17 +1589,132 @@ class PingMatchesRequest(BaseModel):
 
 
 flash_requests: Dict[str, Dict[str, Any]] = {}
-seller_profiles: Dict[str, Dict[str, Any]] = {}
+request_percolator = RequestPercolator()
+seller_pool = SellerPool(
+    text_index_factory=lambda: MinHashLSHIndex(bands=LSH_BANDS, rows=LSH_ROWS),
+    location_index_factory=lambda: SpatialGridIndex(cell_size_m=GEO_GRID_CELL_METERS),
+)
+
+
+gemini_client = PooledHTTPClient(
+    GEMINI_SERVICE_URL,
+    timeout_seconds=GEMINI_TIMEOUT_SECONDS,
+    connect_timeout_seconds=GEMINI_CONNECT_TIMEOUT_SECONDS,
+    max_connections=GEMINI_MAX_CONNECTIONS,
+    max_keepalive_connections=GEMINI_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry_seconds=GEMINI_KEEPALIVE_EXPIRY_SECONDS,
+    http2=GEMINI_HTTP2,
+)
 
 
-async def call_gemini_parser(endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-    url = f"{GEMINI_SERVICE_URL.rstrip('/')}{endpoint}"
+parse_cache = ParseCache(
+    maxsize=PARSE_CACHE_SIZE,
+    ttl_seconds=PARSE_CACHE_TTL_SECONDS,
+    directory=Path(PARSE_CACHE_DIR) if PARSE_CACHE_DIR else None,
+)
+
+
+# Concurrent parse calls for the same cache key share one upstream request.
+parse_flights = SingleFlight()
+
+gemini_breaker = CircuitBreaker(
+    window_size=GEMINI_BREAKER_WINDOW,
+    min_calls=GEMINI_BREAKER_MIN_CALLS,
+    failure_ratio=GEMINI_BREAKER_FAILURE_RATIO,
+    slow_call_seconds=GEMINI_SLOW_CALL_SECONDS,
+    open_seconds=GEMINI_BREAKER_OPEN_SECONDS,
+)
+
+
+async def send_profile_batch(payloads: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Parse several profiles with one request to the parser's batch route.
+    Failed items come back as ``httpx.HTTPStatusError`` carrying the item's
+    status, so callers see the same error as from the single-item route.
+    """
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, json=payload)
-            response.raise_for_status()
-            return response.json()
+        response = await gemini_client.post_json("/api/parse-profile/batch", {"items": payloads})
     except httpx.HTTPStatusError as exc:
+        if exc.response.status_code != 404:
+            raise
+        # A parser service without the batch route: send the items one by one.
+        responses = await asyncio.gather(
+            *(gemini_client.post_json("/api/parse-profile", payload) for payload in payloads),
+            return_exceptions=True,
+        )
+        return [
+            result if isinstance(result, BaseException) else result.json()
+            for result in responses
+        ]
+
+    results: List[Any] = []
+    for item in response.json().get("results") or []:
+        if item.get("ok"):
+            results.append(item.get("data"))
+            continue
+        item_response = httpx.Response(
+            item.get("status") or 500, json={"error": item.get("error")}, request=response.request
+        )
+        results.append(httpx.HTTPStatusError(
+            f"Batch item failed with status {item_response.status_code}",
+            request=response.request,
+            response=item_response,
+        ))
+    return results
+
+
+profile_batcher = MicroBatcher(
+    send_profile_batch,
+    max_batch_size=GEMINI_BATCH_MAX_SIZE,
+    max_wait_seconds=GEMINI_BATCH_WAIT_MS / 1000,
+)
+
+
+async def call_gemini_parser(
+    endpoint: str, payload: Dict[str, Any], timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    cache_key = parse_cache_key(endpoint, payload)
+    cached = await parse_cache.get(cache_key)
+    if cached is not None:
+        return with_caller_text(cached, payload)
+    parsed = await parse_flights.run(
+        cache_key, lambda: fetch_gemini_parse(endpoint, payload, cache_key, timeout)
+    )
+    # Coalesced callers share one result; each gets its own copy to mutate.
+    return with_caller_text(json.loads(json.dumps(parsed)), payload)
+
+
+def with_caller_text(parsed: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Cache keys ignore case and whitespace, so a cached or shared result may
+    echo another caller's wording; restore this caller's own text.
+    """
+    context = parsed.get("context") if isinstance(parsed, dict) else None
+    if isinstance(context, dict) and "text" in payload:
+        context["original_text"] = payload["text"]
+    return parsed
+
+
+async def fetch_gemini_parse(
+    endpoint: str, payload: Dict[str, Any], cache_key: str, timeout: Optional[float]
+) -> Dict[str, Any]:
+    if not gemini_breaker.allow_request():
+        raise HTTPException(
+            status_code=503,
+            detail={"message": "Gemini parsing service is unavailable (circuit breaker open)"},
+        )
+    started = time.monotonic()
+    healthy = False
+    try:
+        if endpoint == "/api/parse-profile" and GEMINI_BATCH_MAX_SIZE > 1:
+            parsed = await profile_batcher.submit(payload)
+        else:
+            response = await gemini_client.post_json(endpoint, payload, timeout_seconds=timeout)
+            parsed = response.json()
+        healthy = True
+    except httpx.HTTPStatusError as exc:
+        # Client errors are the caller's fault, not a sign of an unhealthy service.
+        healthy = exc.response.status_code < 500
         raise HTTPException(
             status_code=exc.response.status_code,
             detail={
@@ -1484,6 +1727,10 @@ async def call_gemini_parser(endpoint: str, payload: Dict[str, Any]) -> Dict[str
             status_code=502,
             detail={"message": f"Gemini parsing service is unavailable: {exc}"},
         ) from exc
+    finally:
+        gemini_breaker.record(healthy, time.monotonic() - started)
+    await parse_cache.put(cache_key, parsed)
+    return parsed
 
 
 def urgency_from_ui(urgency_idx: Optional[int]) -> Optional[str]:
@@ -1539,9 +1786,83 @@ def apply_request_metadata(parsed: Dict[str, Any], metadata: Optional[Dict[str,
         except (TypeError, ValueError):
             pass
 
+    gps = coerce_lat_lng(metadata.get("gps"))
+    if gps:
+        location["device_gps"] = {"lat": gps[0], "lng": gps[1]}
+
     return parsed
 
 
+FALLBACK_PRICE_RE = re.compile(
+    r"\$\s*(\d+(?:\.\d{1,2})?)|(\d+(?:\.\d{1,2})?)\s*(?:dollars|bucks|usd)\b", re.IGNORECASE
+)
+FALLBACK_BORROW_RE = re.compile(r"\b(?:borrow|lend|loan|rent)\b", re.IGNORECASE)
+FALLBACK_URGENCY_PATTERNS: List[Tuple[str, re.Pattern]] = [
+    ("immediate", re.compile(r"\b(?:asap|now|immediately|urgent(?:ly)?|right away|emergency)\b", re.IGNORECASE)),
+    ("high", re.compile(r"\b(?:today|tonight|soon|this (?:morning|afternoon|evening))\b", re.IGNORECASE)),
+    ("low", re.compile(r"\b(?:whenever|no rush|next week|eventually)\b", re.IGNORECASE)),
+]
+FALLBACK_FILLER_WORDS = {
+    "anyone", "anybody", "someone", "need", "needs", "needed", "want", "wants", "looking", "look",
+    "have", "has", "got", "can", "could", "would", "please", "pls", "the", "and", "for", "with",
+    "that", "this", "who", "any", "some", "buy", "borrow", "lend", "loan", "rent", "under", "below",
+    "less", "than", "max", "budget", "dollars", "bucks", "usd", "asap", "now", "today", "tonight",
+    "soon", "urgent", "urgently", "right", "away", "near", "around", "campus", "thanks", "hey",
+    "sell", "selling", "whenever", "rush", "next", "week", "eventually",
+}
+
+
+def local_parse_flash_request(text: str) -> Dict[str, Any]:
+    """
+    Deterministic FLASH_REQUEST parse used while the Gemini service is
+    unavailable: the item is the leading content words, the category is
+    inferred from seller keywords, and price, borrowing, urgency and a
+    campus place are picked out with patterns.
+    """
+    tokens = tokenize(text)
+    place_id = campus_gazetteer.resolve(text)
+    place_words = set(tokenize(campus_gazetteer.name(place_id))) if place_id is not None else set()
+    content: List[str] = []
+    for token in tokens:
+        if token in FALLBACK_FILLER_WORDS or token in place_words or token.isdigit() or token in content:
+            continue
+        content.append(token)
+
+    price_match = FALLBACK_PRICE_RE.search(text)
+    price_max = float(price_match.group(1) or price_match.group(2)) if price_match else None
+    transaction_type = "borrow" if FALLBACK_BORROW_RE.search(text) else "buy"
+    urgency = next(
+        (label for label, pattern in FALLBACK_URGENCY_PATTERNS if pattern.search(text)), "medium"
+    )
+
+    return {
+        "schema_type": "FLASH_REQUEST",
+        "item_meta": {
+            "parsed_item": " ".join(content[:3]) or text.strip(),
+            "category": infer_category_from_tokens(set(tokens)) or "",
+            "tags": content[:5],
+        },
+        "item_attributes": {
+            "primary": {"size": None, "color": None, "condition_requested": []},
+            "secondary": {"material": None, "brand": None},
+        },
+        "transaction": {
+            "type_preferred": transaction_type,
+            "type_acceptable": [transaction_type],
+            "price_max": price_max,
+        },
+        "context": {
+            "urgency": urgency,
+            "reason": None,
+            "original_text": text,
+        },
+        "location": {
+            "text_input": campus_gazetteer.name(place_id) if place_id is not None else None,
+            "device_gps": None,
+        },
+    }
+
+
 def build_representative_item(profile: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     history: List[Dict[str, Any]] = profile.get("sales_history_summary") or []
     if not history:
@@ -1623,24 +1944,35 @@ def score_profile_for_ui(profile: Dict[str, Any], request_id: str) -> Dict[str,
     }
 
 
-def compute_shared_traits(request: Dict[str, Any], profile: Dict[str, Any], item: Optional[Dict[str, Any]]) -> List[str]:
+def seller_profile_traits(profile: Dict[str, Any]) -> Tuple[str, ...]:
+    """Request-independent shared traits; "Same category speciality" is added per match."""
     traits: List[str] = []
-    request_category = (request.get("item_meta") or {}).get("category")
-    item_category = (item or {}).get("item_meta", {}).get("category") if item else None
     seller_major = profile.get("inferred_major")
-
-    if request_category and item_category and request_category.lower() == item_category.lower():
-        traits.append("Same category speciality")
     if seller_major:
         traits.append(f"{seller_major} major")
     location_keywords = profile.get("inferred_location_keywords") or []
     if location_keywords:
         traits.append(f"Near {location_keywords[0]}")
+    return tuple(traits)
+
+
+def compute_shared_traits(record: SellerRecord, category_match: bool) -> List[str]:
+    traits = ["Same category speciality"] if category_match else []
+    traits.extend(record.traits)
     if not traits:
         traits.append("Active campus seller")
     return traits
 
 
+def heuristic_boost(keyword_overlap: int, category_match: bool, tag_overlap: int) -> float:
+    boost = min(keyword_overlap * 0.05, 0.25)
+    if category_match:
+        boost += 0.15
+    if tag_overlap:
+        boost += min(tag_overlap * 0.04, 0.12)
+    return boost
+
+
 def encode_and_score(request_record: Dict[str, Any], profile_record: Dict[str, Any]) -> Tuple[float, List[Tuple[str, float]]]:
     feature_row, activated = encoder.encode(
         request_record["parsed_request"],
@@ -1652,10 +1984,192 @@ def encode_and_score(request_record: Dict[str, Any], profile_record: Dict[str, A
     return probability, activated
 
 
-def seed_profiles_from_synthetic(limit: int = 150) -> int:
+def seller_profile_passages(profile_record: Dict[str, Any]) -> List[str]:
+    parsed_profile = profile_record.get("parsed_profile") or {}
+    passages: List[Any] = [
+        profile_record.get("raw_text"),
+        (parsed_profile.get("context") or {}).get("original_text"),
+        " ".join(str(keyword) for keyword in parsed_profile.get("profile_keywords") or []),
+    ]
+    for summary in parsed_profile.get("sales_history_summary") or []:
+        passages.extend(summary.get("item_examples") or [])
+
+    representative_item = profile_record.get("representative_item") or {}
+    item_meta = representative_item.get("item_meta") or {}
+    passages.append(item_meta.get("parsed_item"))
+    passages.append((representative_item.get("context") or {}).get("original_text"))
+
+    unique: List[str] = []
+    for passage in passages:
+        if isinstance(passage, str) and passage.strip() and passage not in unique:
+            unique.append(passage)
+    return unique
+
+
+def seller_profile_place(profile_record: Dict[str, Any]) -> Optional[int]:
+    location = (profile_record.get("representative_item") or {}).get("location") or {}
+    parsed_profile = profile_record.get("parsed_profile") or {}
+    return campus_gazetteer.resolve_first(
+        [location.get("text_input"), *(parsed_profile.get("inferred_location_keywords") or [])]
+    )
+
+
+def seller_profile_gps(profile_record: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    location = (profile_record.get("representative_item") or {}).get("location") or {}
+    return coerce_lat_lng(location.get("device_gps"))
+
+
+def seller_profile_position(profile_record: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    gps = seller_profile_gps(profile_record)
+    if gps:
+        return gps
+    place_id = seller_profile_place(profile_record)
+    return campus_gazetteer.position(place_id) if place_id is not None else None
+
+
+def build_seller_record(profile_record: Dict[str, Any]) -> SellerRecord:
+    user_id = profile_record["user_id"]
+    parsed_profile = profile_record.get("parsed_profile") or {}
+    rep_item_meta = (profile_record.get("representative_item") or {}).get("item_meta") or {}
+    return SellerRecord(
+        user_id=user_id,
+        display_name=display_name_from_user_id(user_id),
+        major=parsed_profile.get("inferred_major") or "Undeclared",
+        dorm=(parsed_profile.get("inferred_location_keywords") or ["On campus"])[0],
+        category=(rep_item_meta.get("category") or "").strip(),
+        tag_tokens=frozenset(tokens_from_iterable(rep_item_meta.get("tags"))),
+        keywords=frozenset(SELLER_KEYWORD_INDEX.get(user_id, ())),
+        traits=seller_profile_traits(parsed_profile),
+        place_id=seller_profile_place(profile_record),
+        position=seller_profile_position(profile_record),
+        source=profile_record.get("source"),
+        profile=profile_record,
+    )
+
+
+def seller_pool_entry(profile_record: Dict[str, Any]) -> PoolEntry:
+    return build_seller_record(profile_record), seller_profile_passages(profile_record)
+
+
+def request_radius_meters(request_record: Dict[str, Any]) -> float:
+    metadata = request_record.get("metadata") or {}
+    try:
+        return max(float(metadata.get("radiusMeters", MATCH_RADIUS_METERS)), 0.0)
+    except (TypeError, ValueError):
+        return MATCH_RADIUS_METERS
+
+
+def request_query_text(request_record: Dict[str, Any]) -> str:
+    context = (request_record.get("parsed_request") or {}).get("context") or {}
+    return context.get("original_text") or request_record.get("raw_text") or ""
+
+
+def coerce_price(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def category_terms(category: Optional[str]) -> Set[str]:
+    """Percolator terms for a category: as given, and as the listings catalog names it."""
+    key = (category or "").strip().lower()
+    if not key:
+        return set()
+    terms = {f"category:{key}"}
+    listing_key = normalize_category(key).lower()
+    if listing_key != "other":
+        terms.add(f"category:{listing_key}")
+    return terms
+
+
+def standing_request_terms(request_record: Dict[str, Any]) -> Set[str]:
+    item_meta = (request_record.get("parsed_request") or {}).get("item_meta") or {}
+    tag_tokens = tokens_from_iterable(item_meta.get("tags")) or set(tokenize(item_meta.get("parsed_item")))
+    return category_terms(item_meta.get("category")) | {f"tag:{token}" for token in tag_tokens}
+
+
+def register_standing_request(request_id: str, request_record: Dict[str, Any]) -> None:
+    transaction = (request_record.get("parsed_request") or {}).get("transaction") or {}
+    request_record["status"] = "open"
+    request_percolator.register(
+        request_id, standing_request_terms(request_record), coerce_price(transaction.get("price_max"))
+    )
+
+
+def add_standing_alert(request_record: Dict[str, Any], alert: Dict[str, Any]) -> None:
+    # A re-published seller or listing replaces its earlier alert.
+    alerts = [
+        existing
+        for existing in request_record.get("alerts") or []
+        if (existing["kind"], existing["id"]) != (alert["kind"], alert["id"])
+    ]
+    alerts.append(alert)
+    request_record["alerts"] = alerts[-STANDING_ALERTS_MAX:]
+
+
+def percolate_seller_records(records: Iterable[SellerRecord]) -> int:
+    """Re-score the open requests each new seller could satisfy; returns the alerts raised."""
+    raised = 0
+    for record in records:
+        rep_item = record.profile.get("representative_item") or {}
+        price = coerce_price((rep_item.get("transaction") or {}).get("price"))
+        terms = category_terms(record.category) | {f"tag:{token}" for token in record.tag_tokens}
+        for request_id, matched in request_percolator.percolate(terms, price).items():
+            request_record = flash_requests.get(request_id)
+            if not request_record:
+                continue
+            probability, _ = encode_and_score(request_record, record.profile)
+            request_category = ((request_record["parsed_request"].get("item_meta") or {}).get("category") or "")
+            category_match = bool(record.category_key) and request_category.strip().lower() == record.category_key
+            boost = heuristic_boost(
+                len(extract_request_tokens(request_record) & record.keywords),
+                category_match,
+                sum(1 for term in matched if term.startswith("tag:")),
+            )
+            likelihood = round(min(probability + boost, 0.999) * 100, 1)
+            if likelihood < STANDING_MATCH_MIN_LIKELIHOOD:
+                continue
+            add_standing_alert(request_record, {
+                "kind": "seller",
+                "id": record.user_id,
+                "name": record.display_name,
+                "likelihood": likelihood,
+                "matchedOn": sorted(matched),
+                "createdAt": datetime.utcnow().isoformat(),
+            })
+            raised += 1
+    return raised
+
+
+def percolate_new_listings(previous: ListingsIndex, current: ListingsIndex) -> None:
+    """Catalog reload hook: alert open requests about listings that were not in ``previous``."""
+    if not len(request_percolator):
+        return
+    for listing, price in current.added_since(previous):
+        terms = category_terms(listing["category"]) | {f"tag:{token}" for token in tokenize(listing["title"])}
+        for request_id, matched in request_percolator.percolate(terms, price).items():
+            request_record = flash_requests.get(request_id)
+            if not request_record:
+                continue
+            add_standing_alert(request_record, {
+                "kind": "listing",
+                "id": listing["id"],
+                "title": listing["title"],
+                "price": listing["price"],
+                "sellerId": listing["owner"]["id"],
+                "matchedOn": sorted(matched),
+                "createdAt": datetime.utcnow().isoformat(),
+            })
+
+
+def seed_profiles_from_synthetic(limit: int = 150) -> List[PoolEntry]:
+    """Publish synthetic seller profiles not yet in the pool; returns the entries published."""
     if not SYNTHETIC_DATA_DIR.exists():
-        return 0
-    loaded = 0
+        return []
+    existing = seller_pool.snapshot()
+    entries: List[PoolEntry] = []
+    seen: Set[str] = set()
     for json_path in sorted(SYNTHETIC_DATA_DIR.glob("*.json")):
         try:
             data = json.loads(json_path.read_text(encoding="utf-8"))
@@ -1666,9 +2180,10 @@ def seed_profiles_from_synthetic(limit: int = 150) -> int:
         if not seller_profile or not seller_profile.get("user_id"):
             continue
         user_id = seller_profile["user_id"]
-        if user_id in seller_profiles:
+        if user_id in existing or user_id in seen:
             continue
-        seller_profiles[user_id] = {
+        seen.add(user_id)
+        entries.append(seller_pool_entry({
             "user_id": user_id,
             "parsed_profile": seller_profile,
             "raw_text": (seller_profile.get("context") or {}).get("original_text"),
@@ -1676,22 +2191,21 @@ def seed_profiles_from_synthetic(limit: int = 150) -> int:
             "created_at": datetime.utcnow().isoformat(),
             "source": "synthetic",
             "metadata": {"seed_path": str(json_path)},
-        }
-        loaded += 1
-        if limit and loaded >= limit:
+        }))
+        if limit and len(entries) >= limit:
             break
-    return loaded
+    # The snapshot check above only skips work; a concurrent seed may have
+    # added some of these users since, so publish_new re-checks under the lock.
+    return seller_pool.publish_new(entries) if entries else []
 
 
 def load_demo_profiles() -> int:
-    global seller_profiles
-    seller_profiles.clear()
-    inserted = 0
+    entries: Dict[str, PoolEntry] = {}
     for entry in DEMO_SELLER_PROFILES:
         user_id = entry["user_id"]
-        if user_id in seller_profiles:
+        if user_id in entries:
             continue
-        seller_profiles[user_id] = {
+        entries[user_id] = seller_pool_entry({
             "user_id": user_id,
             "parsed_profile": entry["parsed_profile"],
             "raw_text": entry.get("raw_text"),
@@ -1699,12 +2213,14 @@ def load_demo_profiles() -> int:
             "created_at": datetime.utcnow().isoformat(),
             "source": "demo",
             "metadata": {"note": "demo_profile"},
-        }
-        inserted += 1
-    return inserted
+        })
+    seller_pool.publish(entries.values(), replace=True)
+    return len(entries)
 
 
 def build_match_payload(request_id: str, request_record: Dict[str, Any]) -> Dict[str, Any]:
+    # Score against one immutable generation, even if a writer publishes mid-request.
+    pool = seller_pool.snapshot()
     matches: List[Dict[str, Any]] = []
     parsed_request = request_record.get("parsed_request") or {}
     item_meta = parsed_request.setdefault("item_meta", {}) or {}
@@ -1722,55 +2238,84 @@ def build_match_payload(request_id: str, request_record: Dict[str, Any]) -> Dict
     for tag in item_meta.get("tags") or []:
         request_tag_tokens.update(tokenize(tag))
 
-    for profile in seller_profiles.values():
-        probability, activated = encode_and_score(request_record, profile)
-        rng = pseudo_random(f"{request_id}::{profile['user_id']}")
-        distance_minutes = round(rng.uniform(0.2, 3.5), 2)
-        traits = compute_shared_traits(
-            request_record["parsed_request"],
-            profile["parsed_profile"],
-            profile.get("representative_item"),
-        )
-
-        seller_id = profile["user_id"]
-        seller_keywords = SELLER_KEYWORD_INDEX.get(seller_id, set())
-        keyword_overlap = len(request_tokens & seller_keywords)
-
-        representative_item = profile.get("representative_item") or {}
-        rep_item_meta = representative_item.get("item_meta") or {}
-        rep_category = (rep_item_meta.get("category") or "").strip()
-        category_match = (
-            bool(request_category)
-            and bool(rep_category)
-            and request_category.lower() == rep_category.lower()
+    request_location = parsed_request.get("location") or {}
+    request_place = campus_gazetteer.resolve(request_location.get("text_input"))
+    request_gps = coerce_lat_lng(request_location.get("device_gps"))
+    request_position = request_gps
+    if request_position is None and request_place is not None:
+        request_position = campus_gazetteer.position(request_place)
+    radius_meters = request_radius_meters(request_record)
+
+    # Large pools only score sellers whose text is near the request's text, and
+    # a radius keeps distant sellers out of scoring entirely.
+    candidate_ids: Optional[List[str]] = None
+    text_similarity: Dict[str, float] = {}
+    if len(pool) >= LSH_PREFILTER_MIN_POOL:
+        hits = pool.text_index.query(
+            request_query_text(request_record), top_n=LSH_TOP_N, probe_bands=LSH_PROBE_BANDS
         )
+        text_similarity = {user_id: similarity for user_id, similarity in hits}
+        if text_similarity:
+            candidate_ids = list(text_similarity)
+
+    seller_distances: Dict[str, float] = {}
+    if request_position and radius_meters > 0:
+        seller_distances = dict(pool.locations.within(request_position, radius_meters))
+        if candidate_ids is None:
+            candidate_ids = list(seller_distances)
+        else:
+            candidate_ids = [user_id for user_id in candidate_ids if user_id in seller_distances]
+
+    candidates: Iterable[SellerRecord] = (
+        pool.records.values()
+        if candidate_ids is None
+        else [pool.records[user_id] for user_id in candidate_ids if user_id in pool.records]
+    )
+    request_category_key = request_category.lower()
 
-        seller_tag_tokens: Set[str] = set()
-        for tag in rep_item_meta.get("tags") or []:
-            seller_tag_tokens.update(tokenize(tag))
-        tag_overlap = len(request_tag_tokens & seller_tag_tokens)
-
-        boost = min(keyword_overlap * 0.05, 0.25)
-        if category_match:
-            boost += 0.15
-        if tag_overlap:
-            boost += min(tag_overlap * 0.04, 0.12)
-
-        boosted_probability = min(probability + boost, 0.999)
+    for record in candidates:
+        profile = record.profile
+        seller_id = record.user_id
+        probability, activated = encode_and_score(request_record, profile)
+        distance_meters = seller_distances.get(seller_id)
+        if distance_meters is None and request_position and record.position:
+            distance_meters = haversine_meters(request_position, record.position)
+        # The walking matrix beats a straight line between place centroids, but
+        # not a real distance between two GPS fixes.
+        if (
+            request_place is not None
+            and record.place_id is not None
+            and not (request_gps and seller_profile_gps(profile))
+        ):
+            distance_meters = campus_gazetteer.distance_meters(request_place, record.place_id)
+            distance_minutes = campus_gazetteer.walking_minutes(request_place, record.place_id)
+        elif distance_meters is not None:
+            distance_minutes = walking_minutes(distance_meters)
+        else:
+            rng = pseudo_random(f"{request_id}::{seller_id}")
+            distance_minutes = round(rng.uniform(0.2, 3.5), 2)
+
+        keyword_overlap = len(request_tokens & record.keywords)
+        category_match = bool(request_category_key) and request_category_key == record.category_key
+        tag_overlap = len(request_tag_tokens & record.tag_tokens)
+        traits = compute_shared_traits(record, category_match)
+
+        boosted_probability = min(probability + heuristic_boost(keyword_overlap, category_match, tag_overlap), 0.999)
 
         ui_stats = score_profile_for_ui(profile["parsed_profile"], request_id)
         matches.append(
             {
                 "user": {
-                    "id": profile["user_id"],
-                    "name": display_name_from_user_id(profile["user_id"]),
-                    "major": profile["parsed_profile"].get("inferred_major") or "Undeclared",
-                    "dorm": (profile["parsed_profile"].get("inferred_location_keywords") or ["On campus"])[0],
+                    "id": seller_id,
+                    "name": record.display_name,
+                    "major": record.major,
+                    "dorm": record.dorm,
                     "verified": "Verified Student" in ui_stats["badges"],
                     **ui_stats,
                 },
                 "likelihood": round(boosted_probability * 100, 1),
                 "distanceMin": distance_minutes,
+                "distanceMeters": round(distance_meters) if distance_meters is not None else None,
                 "sharedTraits": traits,
                 "debug": {
                     "probability": boosted_probability,
@@ -1778,11 +2323,12 @@ def build_match_payload(request_id: str, request_record: Dict[str, Any]) -> Dict
                     "activatedFeatures": activated[:40],
                     "representativeItem": profile.get("representative_item"),
                     "sellerProfile": profile.get("parsed_profile"),
-                    "source": profile.get("source"),
+                    "source": record.source,
                     "heuristics": {
                         "keywordOverlap": keyword_overlap,
                         "categoryMatch": category_match,
                         "tagOverlap": tag_overlap,
+                        "textSimilarity": text_similarity.get(seller_id),
                         "boostApplied": round(max(boosted_probability - probability, 0.0), 4),
                     },
                 },
@@ -1831,6 +2377,8 @@ def build_match_payload(request_id: str, request_record: Dict[str, Any]) -> Dict
                 "artifact": MODEL_PATH.name,
             },
             "requestMetadata": request_record.get("metadata"),
+            "parser": request_record.get("parser", "gemini"),
+            "poolGeneration": pool.generation,
             "generatedAt": datetime.utcnow().isoformat(),
         },
     }
@@ -1844,13 +2392,22 @@ async def startup_event() -> None:
     except Exception as e:
         print(f"[WARNING] MongoDB connection failed on startup: {e}")
         print("[WARNING] App will continue but user features may not work")
+    gemini_client.start()
+    profile_jobs.start()
     # Load demo profiles (for in-memory matching)
     loop = asyncio.get_event_loop()
     await loop.run_in_executor(None, load_demo_profiles)
+    # Build the listings index before serving, then keep it current.
+    await catalog_watcher.refresh()
+    catalog_watcher.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
+    await catalog_watcher.stop()
+    await profile_jobs.stop()
+    await profile_batcher.close()
+    await gemini_client.close()
     await close_db()
 
 
@@ -1859,8 +2416,18 @@ async def health() -> Dict[str, Any]:
     return {
         "status": "ok",
         "modelLoaded": MODEL_PATH.name,
-        "profiles": len(seller_profiles),
+        "profiles": len(seller_pool.snapshot()),
+        "poolGeneration": seller_pool.generation,
         "requests": len(flash_requests),
+        "standingRequests": request_percolator.stats(),
+        "catalogGeneration": catalog_watcher.current.generation,
+        "listingsQueryCache": listings_query_cache.stats(),
+        "geminiClient": gemini_client.stats(),
+        "parseCache": parse_cache.stats(),
+        "parseFlights": parse_flights.stats(),
+        "geminiBreaker": gemini_breaker.stats(),
+        "profileBatcher": profile_batcher.stats(),
+        "profileJobs": profile_jobs.stats(),
     }
 
 
@@ -1869,7 +2436,18 @@ async def create_flash_request(payload: FlashRequestCreate) -> Dict[str, Any]:
     if not payload.text.strip():
         raise HTTPException(status_code=400, detail="Flash request text cannot be empty.")
 
-    parsed = await call_gemini_parser("/api/parse-request", {"text": payload.text})
+    parser = "gemini"
+    try:
+        parsed = await call_gemini_parser(
+            "/api/parse-request", {"text": payload.text}, timeout=GEMINI_FLASH_REQUEST_TIMEOUT_SECONDS
+        )
+    except HTTPException as exc:
+        if exc.status_code < 500:
+            raise
+        # Keep matching available while the parser service is down or slow.
+        print(f"[WARNING] Falling back to the local flash request parser: {exc.detail}")
+        parsed = local_parse_flash_request(payload.text)
+        parser = "local"
     parsed = apply_request_metadata(parsed, payload.metadata)
 
     request_id = str(uuid.uuid4())
@@ -1879,9 +2457,13 @@ async def create_flash_request(payload: FlashRequestCreate) -> Dict[str, Any]:
         "parsed_request": parsed,
         "created_at": datetime.utcnow().isoformat(),
         "metadata": payload.metadata or {},
+        "parser": parser,
     }
 
-    return build_match_payload(request_id, flash_requests[request_id])
+    # Scoring fills in an inferred category, so index the request afterwards.
+    result = build_match_payload(request_id, flash_requests[request_id])
+    register_standing_request(request_id, flash_requests[request_id])
+    return result
 
 
 @app.get("/api/flash-requests/{request_id}")
@@ -1894,9 +2476,34 @@ async def get_flash_request(request_id: str) -> Dict[str, Any]:
         "requestId": request_id,
         "request": record["parsed_request"],
         "metadata": record.get("metadata"),
+        "status": record.get("status", "open"),
     }
 
 
+@app.get("/api/flash-requests/{request_id}/alerts")
+async def get_flash_request_alerts(request_id: str) -> Dict[str, Any]:
+    """Sellers and listings that arrived after the request was made and could satisfy it."""
+    record = flash_requests.get(request_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="Flash request not found.")
+    return {
+        "success": True,
+        "requestId": request_id,
+        "status": record.get("status", "open"),
+        "alerts": record.get("alerts") or [],
+    }
+
+
+@app.post("/api/flash-requests/{request_id}/close")
+async def close_flash_request(request_id: str) -> Dict[str, Any]:
+    record = flash_requests.get(request_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="Flash request not found.")
+    request_percolator.unregister(request_id)
+    record["status"] = "closed"
+    return {"success": True, "requestId": request_id, "status": "closed"}
+
+
 @app.get("/api/flash-requests/{request_id}/matches")
 async def get_flash_request_matches(request_id: str) -> Dict[str, Any]:
     record = flash_requests.get(request_id)
@@ -1905,6 +2512,32 @@ async def get_flash_request_matches(request_id: str) -> Dict[str, Any]:
     return build_match_payload(request_id, record)
 
 
+@app.get("/api/flash-requests/{request_id}/similar-sellers")
+async def get_similar_sellers(
+    request_id: str, limit: int = 10, probeBands: Optional[int] = None
+) -> Dict[str, Any]:
+    record = flash_requests.get(request_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="Flash request not found.")
+    hits = seller_pool.snapshot().text_index.query(
+        request_query_text(record),
+        top_n=max(1, limit),
+        probe_bands=probeBands if probeBands is not None else LSH_PROBE_BANDS,
+    )
+    return {
+        "success": True,
+        "requestId": request_id,
+        "sellers": [
+            {
+                "userId": user_id,
+                "name": display_name_from_user_id(user_id),
+                "similarity": round(similarity, 4),
+            }
+            for user_id, similarity in hits
+        ],
+    }
+
+
 @app.post("/api/profiles")
 async def create_seller_profile(payload: SellerProfileCreate) -> Dict[str, Any]:
     if not payload.text.strip():
@@ -1916,7 +2549,7 @@ async def create_seller_profile(payload: SellerProfileCreate) -> Dict[str, Any]:
 
     representative_item = build_representative_item(parsed_profile)
 
-    seller_profiles[payload.user_id] = {
+    entry = seller_pool_entry({
         "user_id": payload.user_id,
         "raw_text": payload.text,
         "parsed_profile": parsed_profile,
@@ -1924,18 +2557,27 @@ async def create_seller_profile(payload: SellerProfileCreate) -> Dict[str, Any]:
         "created_at": datetime.utcnow().isoformat(),
         "source": "live",
         "metadata": payload.metadata or {},
-    }
+    })
+    snapshot = await asyncio.to_thread(seller_pool.publish, [entry])
+    percolate_seller_records([entry[0]])
 
     return {
         "success": True,
         "profile": parsed_profile,
         "representativeItem": representative_item,
-        "totalProfiles": len(seller_profiles),
+        "totalProfiles": len(snapshot),
+        "generation": snapshot.generation,
     }
 
 
 @app.get("/api/profiles")
-async def list_profiles() -> Dict[str, Any]:
+async def list_profiles(request: Request, response: Response) -> Dict[str, Any]:
+    snapshot = seller_pool.snapshot()
+    etag = make_etag("profiles", SELLER_POOL_BOOT_ID, snapshot.generation)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag, PROFILES_CACHE_CONTROL)
+    set_cache_headers(response, etag, PROFILES_CACHE_CONTROL)
+
     summaries = [
         {
             "userId": profile["user_id"],
@@ -1946,20 +2588,23 @@ async def list_profiles() -> Dict[str, Any]:
                 "overall_dominant_transaction_type"
             ),
         }
-        for profile in seller_profiles.values()
+        for profile in snapshot.profiles.values()
     ]
     summaries.sort(key=lambda entry: entry["userId"])
-    return {"success": True, "profiles": summaries}
+    return {"success": True, "profiles": summaries, "generation": snapshot.generation}
 
 
 @app.post("/api/profiles/seed")
 async def seed_profiles(limit: int = 150) -> Dict[str, Any]:
     loop = asyncio.get_event_loop()
-    loaded = await loop.run_in_executor(None, seed_profiles_from_synthetic, limit)
+    entries = await loop.run_in_executor(None, seed_profiles_from_synthetic, limit)
+    # Standing requests are only touched on the event loop.
+    percolate_seller_records(record for record, _ in entries)
     return {
         "success": True,
-        "loaded": loaded,
-        "totalProfiles": len(seller_profiles),
+        "loaded": len(entries),
+        "totalProfiles": len(seller_pool.snapshot()),
+        "generation": seller_pool.generation,
     }
 
 
@@ -1982,7 +2627,12 @@ async def send_pings(request_id: str, payload: PingMatchesRequest) -> Dict[str,
 
 
 @app.get("/api/profiles/{user_id}/history")
-async def get_profile_history(user_id: str, cursor: Optional[int] = None) -> Dict[str, Any]:
+async def get_profile_history(
+    request: Request,
+    response: Response,
+    user_id: str,
+    cursor: Optional[int] = None,
+) -> Dict[str, Any]:
     history = DEMO_PROFILE_HISTORY.get(user_id)
     if history is None:
         raise HTTPException(status_code=404, detail="Profile history not found.")
@@ -1991,6 +2641,11 @@ async def get_profile_history(user_id: str, cursor: Optional[int] = None) -> Dic
     if start < 0:
         start = 0
 
+    etag = make_etag("history", PROFILE_HISTORY_VERSION, user_id, start)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag, PROFILE_HISTORY_CACHE_CONTROL)
+    set_cache_headers(response, etag, PROFILE_HISTORY_CACHE_CONTROL)
+
     page_size = 10
     end = start + page_size
     transactions = history[start:end]
@@ -2009,231 +2664,140 @@ async def get_profile_history(user_id: str, cursor: Optional[int] = None) -> Dic
 # Listings Endpoint
 # ============================================================================
 
-_campus_sellers_cache: Optional[List[Dict[str, Any]]] = None
-_campus_sellers_cache_time: Optional[float] = None
-
-
-def load_campus_sellers(use_cache: bool = True) -> List[Dict[str, Any]]:
-    """Load sellers from campus_sellers.json with caching."""
-    global _campus_sellers_cache, _campus_sellers_cache_time
-    
-    if use_cache and _campus_sellers_cache is not None:
-        # Check if file was modified (simple cache invalidation)
-        try:
-            mtime = CAMPUS_SELLERS_PATH.stat().st_mtime
-            if _campus_sellers_cache_time == mtime:
-                return _campus_sellers_cache
-        except OSError:
-            pass
-    
-    if not CAMPUS_SELLERS_PATH.exists():
-        return []
-    
+def build_listings_index(previous: ListingsIndex) -> Optional[ListingsIndex]:
+    """
+    Stream campus_sellers.json into a new listings index, one seller at a
+    time.  Returns None if the file cannot be parsed.
+    """
+    generation = previous.generation + 1
     try:
-        with open(CAMPUS_SELLERS_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            sellers = data.get("sellers", [])
-            _campus_sellers_cache = sellers
-            _campus_sellers_cache_time = CAMPUS_SELLERS_PATH.stat().st_mtime
-            return sellers
-    except (json.JSONDecodeError, OSError) as e:
+        mtime = CAMPUS_SELLERS_PATH.stat().st_mtime
+    except OSError:
+        return ListingsIndex([], campus_gazetteer, generation=generation)
+    try:
+        return ListingsIndex(
+            iter_catalog_sellers(CAMPUS_SELLERS_PATH),
+            campus_gazetteer,
+            generation=generation,
+            mtime=mtime,
+        )
+    except (ValueError, OSError) as e:
         print(f"Error loading campus_sellers.json: {e}")
-        return []
+        return None
 
 
-def normalize_category(category: str) -> str:
-    """Normalize backend category to frontend category."""
-    if not category:
-        return "Other"
-    category_lower = category.lower().replace("_", " ")
-    if "textbook" in category_lower:
-        return "Textbooks"
-    elif "electronic" in category_lower:
-        return "Electronics"
-    elif "cloth" in category_lower:
-        return "Clothing"
-    elif "food" in category_lower or "snack" in category_lower:
-        return "Food"
-    elif "furniture" in category_lower or "furnish" in category_lower:
-        return "Furniture"
-    else:
-        return "Other"
-
-
-def get_category_emoji(category: str) -> str:
-    """Get emoji based on category."""
-    category_lower = category.lower()
-    if "textbook" in category_lower:
-        return "📚"
-    elif "electronic" in category_lower:
-        return "💻"
-    elif "cloth" in category_lower:
-        return "👕"
-    elif "food" in category_lower:
-        return "🍕"
-    elif "furniture" in category_lower:
-        return "🪑"
-    else:
-        return "📦"
-
-
-def calculate_seller_badges(seller: Dict[str, Any]) -> List[str]:
-    """Calculate badges for a seller based on their stats."""
-    badges = []
-    
-    # Verified Student - if seller has a rating, consider them verified
-    if seller.get("seller_rating_avg", 0) > 0:
-        badges.append("Verified Student")
-    
-    # Top Seller - if total items sold > 20
-    total_items_sold = sum(
-        s.get("total_items_sold", 0) 
-        for s in seller.get("sales_history_summary", [])
-    )
-    if total_items_sold > 20:
-        badges.append("Top Seller")
-    
-    # Campus Leader - if trust score > 90
-    # Calculate trust score: base 70 + up to 25 based on rating + items sold
-    rating = seller.get("seller_rating_avg", 0)
-    trust_score = min(95, 70 + min(15, (rating - 3) * 5) + min(10, total_items_sold // 5))
-    if trust_score > 90:
-        badges.append("Campus Leader")
-    
-    return badges
-
+# The listings index is rebuilt by a background watcher whenever
+# campus_sellers.json changes; request handlers only read catalog_watcher.current.
+catalog_watcher = CatalogWatcher(
+    CAMPUS_SELLERS_PATH,
+    build_listings_index,
+    initial=ListingsIndex([], campus_gazetteer),
+    interval_seconds=CATALOG_POLL_SECONDS,
+    on_publish=percolate_new_listings,
+)
 
-def calculate_trust_score(seller: Dict[str, Any]) -> int:
-    """Calculate trust score for a seller."""
-    rating = seller.get("seller_rating_avg", 0)
-    total_items_sold = sum(
-        s.get("total_items_sold", 0) 
-        for s in seller.get("sales_history_summary", [])
-    )
-    # Base score 70, add up to 15 for rating, up to 10 for volume
-    return min(95, 70 + min(15, int((rating - 3) * 5)) + min(10, total_items_sold // 5))
+# Results of recent listing queries, dropped whenever the catalog reloads.
+listings_query_cache = TTLCache(maxsize=LISTINGS_QUERY_CACHE_SIZE, ttl_seconds=LISTINGS_QUERY_CACHE_TTL_SECONDS)
 
 
 @app.get("/api/listings")
 async def get_listings(
+    request: Request,
+    response: Response,
     search: Optional[str] = None,
     category: Optional[str] = None,
+    condition: Optional[str] = None,
+    priceMin: Optional[float] = None,
     priceMax: Optional[float] = None,
     verifiedOnly: Optional[bool] = None,
+    near: Optional[str] = None,
+    maxWalkMinutes: Optional[float] = None,
+    sort: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Get listings from campus_sellers.json with filtering."""
-    sellers = load_campus_sellers(use_cache=True)
-    
-    all_listings = []
-    
-    # Extract all listings from all sellers
-    for seller in sellers:
-        seller_listings = seller.get("current_item_listings", [])
-        if not seller_listings:
-            continue
-        
-        # Calculate seller stats
-        total_items_sold = sum(
-            s.get("total_items_sold", 0) 
-            for s in seller.get("sales_history_summary", [])
+    """
+    Get one page of listings from campus_sellers.json with filtering, plus
+    per-facet counts for the filtered set.  Pass the returned ``nextCursor``
+    back as ``cursor`` to fetch the next page.
+    """
+    index: ListingsIndex = catalog_watcher.current
+    near_place = campus_gazetteer.resolve(near) if near else None
+    page_size = LISTINGS_PAGE_SIZE if limit is None else limit
+    page_size = max(1, min(page_size, LISTINGS_MAX_PAGE_SIZE))
+
+    normalized_query = {
+        "search": " ".join(sorted(set(tokenize_search_text(search)))) if search else None,
+        "category": category if category and category != "All" else None,
+        "condition": condition.lower() if condition else None,
+        "priceMin": priceMin,
+        "priceMax": priceMax,
+        "verifiedOnly": bool(verifiedOnly),
+        "near": near_place if maxWalkMinutes is not None else None,
+        "maxWalkMinutes": maxWalkMinutes if near_place is not None else None,
+        "sort": sort,
+        "limit": page_size,
+        "cursor": cursor,
+    }
+    etag = make_etag("listings", index.mtime, normalized_query)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag, LISTINGS_CACHE_CONTROL)
+    set_cache_headers(response, etag, LISTINGS_CACHE_CONTROL)
+
+    cache_key = json.dumps(normalized_query, sort_keys=True)
+    cached = listings_query_cache.get(cache_key, index.generation)
+    if cached is not None:
+        return cached
+
+    try:
+        page = index.query(
+            search=search,
+            category=category,
+            condition=condition,
+            price_min=priceMin,
+            price_max=priceMax,
+            verified_only=bool(verifiedOnly),
+            near_place=near_place,
+            max_walk_minutes=maxWalkMinutes,
+            sort=sort,
+            limit=page_size,
+            cursor=cursor,
         )
-        seller_rating = seller.get("seller_rating_avg", 0)
-        badges = calculate_seller_badges(seller)
-        trust_score = calculate_trust_score(seller)
-        verified = seller_rating > 0
-        
-        # Get seller location
-        location_keywords = seller.get("inferred_location_keywords", [])
-        seller_location = location_keywords[0] if location_keywords else "Campus"
-        
-        # Create listing for each item
-        for listing_index, listing in enumerate(seller_listings):
-            # Generate unique ID
-            listing_id = f"{seller.get('user_id', 'unknown')}-{listing.get('parsed_item', 'item')}-{listing_index}-{listing.get('date_posted', '')}"
-            
-            # Normalize category
-            normalized_category = normalize_category(listing.get("category", "Other"))
-            
-            # Get location - use listing location if available, else seller location
-            listing_location = listing.get("location", "") or seller_location
-            
-            # Format price
-            price = listing.get("price", 0)
-            price_str = f"${int(price)}" if price else "$0"
-            
-            # Format listing
-            formatted_listing = {
-                "id": listing_id,
-                "title": listing.get("parsed_item", "Item"),
-                "category": normalized_category,
-                "price": price_str,
-                "photo": get_category_emoji(listing.get("category", "Other")),
-                "condition": listing.get("condition", ""),
-                "description": listing.get("description", ""),
-                "location": listing_location,
-                "lastActive": listing.get("date_posted", ""),
-                "owner": {
-                    "id": seller.get("user_id", ""),
-                    "name": seller.get("full_name", "Unknown Seller"),
-                    "major": seller.get("inferred_major", "Undeclared"),
-                    "dorm": seller_location,
-                    "rating": round(seller_rating, 2) if seller_rating else 0.0,
-                    "verified": verified,
-                    "trustScore": trust_score,
-                    "pastTrades": total_items_sold,
-                    "badges": badges,
-                },
-            }
-            
-            all_listings.append(formatted_listing)
-    
-    # Apply filters
-    filtered_listings = all_listings
-    
-    # Search filter
-    if search:
-        search_lower = search.lower()
-        filtered_listings = [
-            l for l in filtered_listings
-            if search_lower in l["title"].lower() 
-            or search_lower in l.get("description", "").lower()
-            or search_lower in l.get("condition", "").lower()
-        ]
-    
-    # Category filter
-    if category and category != "All":
-        filtered_listings = [
-            l for l in filtered_listings
-            if l["category"] == category
-        ]
-    
-    # Price filter
-    if priceMax is not None:
-        filtered_listings = [
-            l for l in filtered_listings
-            if float(l["price"].replace("$", "").replace(",", "")) <= priceMax
-        ]
-    
-    # Verified filter
-    if verifiedOnly:
-        filtered_listings = [
-            l for l in filtered_listings
-            if l["owner"]["verified"]
-        ]
-    
-    # Sort by date_posted (newest first)
-    filtered_listings.sort(
-        key=lambda x: x.get("lastActive", ""),
-        reverse=True
-    )
-    
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    result = {
+        "success": True,
+        "listings": page.listings,
+        "total": page.total,
+        "limit": page_size,
+        "nextCursor": page.next_cursor,
+        "facets": page.facets,
+    }
+    listings_query_cache.put(cache_key, result, index.generation)
+    return result
+
+
+@app.get("/api/listings/autocomplete")
+async def autocomplete_listings(q: str = "", limit: int = 8) -> Dict[str, Any]:
+    """Type-ahead suggestions for the listings search box, most popular first."""
+    limit = max(1, min(limit, AUTOCOMPLETE_MAX_SUGGESTIONS))
     return {
         "success": True,
-        "listings": filtered_listings,
-        "total": len(filtered_listings),
+        "query": q,
+        "suggestions": catalog_watcher.current.autocomplete.suggest(q, limit),
     }
 
 
+@app.get("/api/sellers/{user_id}")
+async def get_seller_card(user_id: str) -> Dict[str, Any]:
+    """Seller card for a campus_sellers.json seller, read from the listings index's stats table."""
+    card = catalog_watcher.current.seller_card(user_id)
+    if card is None:
+        raise HTTPException(status_code=404, detail="Seller not found.")
+    return {"success": True, "seller": card}
+
+
 # ============================================================================
 # Authentication Endpoints
 # ============================================================================
@@ -2268,6 +2832,58 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     return user
 
 
+async def save_seller_profile(db: Any, user_id: str, bio: str, parsed_profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Create or update the user's seller profile document; safe to repeat."""
+    now = datetime.utcnow()
+    seller_profile_doc = {
+        "schema_type": "SELLER_PROFILE",
+        "user_id": user_id,
+        "context": parsed_profile.get("context", {"original_text": bio}),
+        "profile_keywords": parsed_profile.get("profile_keywords", []),
+        "inferred_major": parsed_profile.get("inferred_major"),
+        "inferred_location_keywords": parsed_profile.get("inferred_location_keywords", []),
+        "sales_history_summary": parsed_profile.get("sales_history_summary", []),
+        "overall_dominant_transaction_type": parsed_profile.get("overall_dominant_transaction_type", "sell"),
+        "related_categories_of_interest": parsed_profile.get("related_categories_of_interest", []),
+        "updated_at": now,
+    }
+
+    # Upsert so a retry after a partial failure converges on one profile document.
+    saved_profile = await db.seller_profiles.find_one_and_update(
+        {"user_id": user_id},
+        {"$set": seller_profile_doc, "$setOnInsert": {"created_at": now}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+
+    # Always (re)link the user, in case an earlier attempt stopped before this step.
+    await db.users.update_one(
+        {"_id": ObjectId(user_id)},
+        {"$set": {"seller_profile_id": saved_profile["_id"], "updated_at": now}}
+    )
+    return saved_profile
+
+
+async def generate_seller_profile(user_id: str, bio: str) -> None:
+    parsed_profile = await call_gemini_parser("/api/parse-profile", {"text": bio, "userId": user_id})
+    await save_seller_profile(get_db(), user_id, bio, parsed_profile)
+
+
+def profile_job_retryable(exc: BaseException) -> bool:
+    # Rejected input (4xx from the parser) fails the same way on every attempt.
+    return not (isinstance(exc, HTTPException) and exc.status_code < 500)
+
+
+# Background generation of seller profiles for new registrations, one job per user id.
+profile_jobs = JobQueue(
+    concurrency=PROFILE_JOB_CONCURRENCY,
+    max_queued=PROFILE_JOB_MAX_QUEUED,
+    max_attempts=PROFILE_JOB_MAX_ATTEMPTS,
+    retry_base_seconds=PROFILE_JOB_RETRY_SECONDS,
+    should_retry=profile_job_retryable,
+)
+
+
 @app.post("/api/auth/register")
 async def register(user_data: UserCreate) -> Dict[str, Any]:
     """Register a new user with bio processing."""
@@ -2310,41 +2926,20 @@ async def register(user_data: UserCreate) -> Dict[str, Any]:
     result = await db.users.insert_one(user_doc)
     user_id = str(result.inserted_id)
     
-    # Process bio with LLM to generate seller profile
+    # Generate the seller profile in the background; poll profile-status for it.
     try:
-        parsed_profile = await call_gemini_parser(
-            "/api/parse-profile",
-            {"text": user_data.bio, "userId": user_id}
-        )
-        
-        # Create seller profile document
-        seller_profile_doc = {
-            "schema_type": "SELLER_PROFILE",
-            "user_id": user_id,
-            "context": parsed_profile.get("context", {"original_text": user_data.bio}),
-            "profile_keywords": parsed_profile.get("profile_keywords", []),
-            "inferred_major": parsed_profile.get("inferred_major"),
-            "inferred_location_keywords": parsed_profile.get("inferred_location_keywords", []),
-            "sales_history_summary": parsed_profile.get("sales_history_summary", []),
-            "overall_dominant_transaction_type": parsed_profile.get("overall_dominant_transaction_type", "sell"),
-            "related_categories_of_interest": parsed_profile.get("related_categories_of_interest", []),
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
-        }
-        
-        # Insert seller profile
-        profile_result = await db.seller_profiles.insert_one(seller_profile_doc)
-        profile_id = profile_result.inserted_id
-        
-        # Update user with seller profile reference
-        await db.users.update_one(
-            {"_id": ObjectId(user_id)},
-            {"$set": {"seller_profile_id": profile_id, "updated_at": datetime.utcnow()}}
-        )
-        
-    except Exception as e:
-        # If bio processing fails, user is still created but without seller profile
-        print(f"Warning: Failed to process bio for user {user_id}: {e}")
+        job = profile_jobs.submit(user_id, lambda: generate_seller_profile(user_id, user_data.bio))
+        profile_status = job.state
+    except asyncio.QueueFull:
+        # Backlog is full: fall back to processing the bio inline.
+        print(f"Warning: Profile job queue full; processing bio for user {user_id} inline")
+        try:
+            await generate_seller_profile(user_id, user_data.bio)
+            profile_status = "ready"
+        except Exception as e:
+            # If bio processing fails, user is still created but without seller profile
+            print(f"Warning: Failed to process bio for user {user_id}: {e}")
+            profile_status = "failed"
     
     # Create access token
     access_token = create_access_token(data={"sub": user_id})
@@ -2353,6 +2948,7 @@ async def register(user_data: UserCreate) -> Dict[str, Any]:
         "success": True,
         "userId": user_id,
         "accessToken": access_token,
+        "profileStatus": profile_status,
         "message": "User registered successfully"
     }
 
@@ -2468,6 +3064,38 @@ async def get_user_profile(user_id: str) -> Dict[str, Any]:
     }
 
 
+@app.get("/api/users/{user_id}/profile-status")
+async def get_profile_status(user_id: str) -> Dict[str, Any]:
+    """
+    Readiness of the seller profile generated after registration: queued,
+    running, ready, failed, or missing (no job and no profile).
+    """
+    job = profile_jobs.get(user_id)
+    if job is not None and job.state != "succeeded":
+        return {"success": True, "userId": user_id, **job.as_dict()}
+
+    try:
+        db = get_db()
+    except RuntimeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database connection failed. Please check MongoDB connection."
+        )
+    user = await db.users.find_one({"_id": ObjectId(user_id)})
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    job_info = job.as_dict() if job is not None else {}
+    return {
+        "success": True,
+        "userId": user_id,
+        **job_info,
+        "status": "ready" if user.get("seller_profile_id") else "missing",
+    }
+
+
 @app.get("/api/seller-profiles/{user_id}")
 async def get_seller_profile(user_id: str) -> Dict[str, Any]:
     """Get detailed seller profile for a user."""
@@ -2522,41 +3150,7 @@ async def process_bio(request: ProcessBioRequest) -> Dict[str, Any]:
     )
     
     db = get_db()
-    
-    # Check if seller profile already exists
-    existing_profile = await db.seller_profiles.find_one({"user_id": request.userId})
-    
-    seller_profile_doc = {
-        "schema_type": "SELLER_PROFILE",
-        "user_id": request.userId,
-        "context": parsed_profile.get("context", {"original_text": request.bio}),
-        "profile_keywords": parsed_profile.get("profile_keywords", []),
-        "inferred_major": parsed_profile.get("inferred_major"),
-        "inferred_location_keywords": parsed_profile.get("inferred_location_keywords", []),
-        "sales_history_summary": parsed_profile.get("sales_history_summary", []),
-        "overall_dominant_transaction_type": parsed_profile.get("overall_dominant_transaction_type", "sell"),
-        "related_categories_of_interest": parsed_profile.get("related_categories_of_interest", []),
-        "updated_at": datetime.utcnow(),
-    }
-    
-    if existing_profile:
-        # Update existing profile
-        await db.seller_profiles.update_one(
-            {"user_id": request.userId},
-            {"$set": seller_profile_doc}
-        )
-        seller_profile_doc["_id"] = existing_profile["_id"]
-    else:
-        # Create new profile
-        seller_profile_doc["created_at"] = datetime.utcnow()
-        result = await db.seller_profiles.insert_one(seller_profile_doc)
-        seller_profile_doc["_id"] = result.inserted_id
-        
-        # Update user with seller profile reference
-        await db.users.update_one(
-            {"_id": ObjectId(request.userId)},
-            {"$set": {"seller_profile_id": seller_profile_doc["_id"], "updated_at": datetime.utcnow()}}
-        )
+    seller_profile_doc = await save_seller_profile(db, request.userId, request.bio, parsed_profile)
     
     # Convert ObjectId to string
     seller_profile_doc["_id"] = str(seller_profile_doc["_id"])
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import heapq
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_suggestion_text(text: str) -> str:
+    return _NON_ALNUM_RE.sub(" ", str(text).lower()).strip()
+
+
+class SuggestionIndex:
+    """
+    Type-ahead index over short phrases (listing titles, categories, majors,
+    locations) weighted by popularity.
+
+    Phrases are normalised and indexed under every word start ("desk lamp"
+    is found by "de" and by "la") in one sorted array, so a prefix maps to a
+    contiguous range found by binary search.  The best suggestions for every
+    prefix of up to ``precomputed_prefix_chars`` characters, whose ranges
+    are the widest, are computed when the index is built; longer prefixes
+    select the top entries of their (narrow) range with a bounded heap.
+    """
+
+    def __init__(
+        self,
+        suggestions: Iterable[Tuple[str, str, int]],
+        top_k: int = 10,
+        precomputed_prefix_chars: int = 2,
+    ) -> None:
+        # Merge duplicates of (kind, normalised text), keeping the first spelling.
+        merged: Dict[Tuple[str, str], List] = {}
+        for kind, text, weight in suggestions:
+            normalized = normalize_suggestion_text(text)
+            if not normalized or weight <= 0:
+                continue
+            entry = merged.get((kind, normalized))
+            if entry is None:
+                merged[(kind, normalized)] = [kind, str(text).strip(), weight]
+            else:
+                entry[2] += weight
+
+        # Entries in rank order: heaviest first, then alphabetical.
+        entries = sorted(merged.items(), key=lambda item: (-item[1][2], item[0][1], item[0][0]))
+        self._entries: List[Tuple[str, str, int]] = [tuple(entry) for _, entry in entries]
+        self.top_k = top_k
+
+        keys: List[Tuple[str, int]] = []
+        for rank, ((_, normalized), _) in enumerate(entries):
+            words = normalized.split(" ")
+            for start in range(len(words)):
+                keys.append((" ".join(words[start:]), rank))
+        keys.sort()
+        self._keys: List[str] = [key for key, _ in keys]
+        self._ranks: List[int] = [rank for _, rank in keys]
+
+        self._precomputed_chars = precomputed_prefix_chars
+        best: Dict[str, List[int]] = defaultdict(list)
+        for key, rank in keys:
+            for length in range(1, min(precomputed_prefix_chars, len(key)) + 1):
+                best[key[:length]].append(rank)
+        self._precomputed: Dict[str, List[int]] = {
+            prefix: heapq.nsmallest(top_k, set(ranks)) for prefix, ranks in best.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _ranks_for(self, prefix: str, limit: int) -> List[int]:
+        if len(prefix) <= self._precomputed_chars and limit <= self.top_k:
+            return self._precomputed.get(prefix, [])[:limit]
+        start = bisect_left(self._keys, prefix)
+        end = bisect_left(self._keys, prefix + "\uffff", start)
+        return heapq.nsmallest(limit, set(self._ranks[start:end]))
+
+    def suggest(self, prefix: str, limit: int = 8) -> List[Dict[str, object]]:
+        """Top ``limit`` suggestions whose text has a word starting with ``prefix``."""
+        normalized = normalize_suggestion_text(prefix)
+        if not normalized or limit <= 0:
+            return []
+        return [
+            {"text": text, "type": kind, "count": weight}
+            for kind, text, weight in (self._entries[rank] for rank in self._ranks_for(normalized, limit))
+        ]
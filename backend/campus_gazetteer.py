@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import math
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from geo_index import (
+    METERS_PER_DEGREE_LAT,
+    WALKING_DETOUR_FACTOR,
+    WALKING_SPEED_M_PER_MIN,
+    LatLng,
+    haversine_meters,
+)
+
+
+class CampusPlace(NamedTuple):
+    name: str
+    aliases: Tuple[str, ...]
+    east_m: float
+    north_m: float
+
+
+# Approximate layout of the default campus, as metre offsets from the campus
+# centre.  Aliases cover the spellings used by campus_sellers.json, the
+# synthetic seller profiles and the flash request wizard.
+DEFAULT_CAMPUS_PLACES: Tuple[CampusPlace, ...] = (
+    CampusPlace("Central Quad", ("central quad", "main quad", "quad"), 0.0, 0.0),
+    CampusPlace("Main Library", ("main library", "library", "libraries"), 120.0, 90.0),
+    CampusPlace("Student Union", ("student union", "student center", "union"), -140.0, 60.0),
+    CampusPlace("Dining Hall", ("dining hall", "cafeteria"), -210.0, -40.0),
+    CampusPlace(
+        "Engineering Quad",
+        ("engineering quad", "engineering hall", "engineering building"),
+        380.0,
+        210.0,
+    ),
+    CampusPlace("Science Hall", ("science hall", "science building", "science center"), 260.0, -150.0),
+    CampusPlace("Art Building", ("art building", "arts building", "art studio"), -320.0, 250.0),
+    CampusPlace("Music Building", ("music building", "music hall"), -420.0, 140.0),
+    CampusPlace(
+        "Athletic Center",
+        ("athletic center", "gym", "recreation center", "rec center"),
+        150.0,
+        -520.0,
+    ),
+    CampusPlace("North Campus Dorms", ("north campus dorms", "north dorms", "north campus"), -60.0, 720.0),
+    CampusPlace("South Apartments", ("south apartments", "south campus apartments"), -90.0, -780.0),
+    CampusPlace("Parking Lot A", ("parking lot a", "parking lot"), 560.0, -360.0),
+)
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_place_text(text: Optional[str]) -> str:
+    if not text:
+        return ""
+    return _NON_ALNUM_RE.sub(" ", str(text).lower()).strip()
+
+
+class CampusGazetteer:
+    """
+    Normalises free-text location strings to known campus places.
+
+    Place coordinates are fixed when the gazetteer is built, so the walking
+    distance between every pair of places is precomputed into a dense matrix
+    and proximity checks become a single table read.
+    """
+
+    def __init__(self, places: Sequence[CampusPlace], center: LatLng) -> None:
+        self.places: List[CampusPlace] = list(places)
+        self.center = center
+        cos_lat = math.cos(math.radians(center[0]))
+        self.positions: List[LatLng] = [
+            (
+                center[0] + place.north_m / METERS_PER_DEGREE_LAT,
+                center[1] + place.east_m / (METERS_PER_DEGREE_LAT * cos_lat),
+            )
+            for place in self.places
+        ]
+
+        self._alias_to_id: Dict[str, int] = {}
+        for place_id, place in enumerate(self.places):
+            for alias in (place.name, *place.aliases):
+                self._alias_to_id.setdefault(normalize_place_text(alias), place_id)
+        # Longest aliases first so "engineering quad" wins over "quad".
+        self._aliases_by_length = sorted(self._alias_to_id, key=len, reverse=True)
+
+        count = len(self.places)
+        self.distance_m = np.zeros((count, count), dtype=np.float64)
+        for i in range(count):
+            for j in range(i + 1, count):
+                meters = haversine_meters(self.positions[i], self.positions[j])
+                self.distance_m[i, j] = self.distance_m[j, i] = meters
+        self.walk_minutes = np.round(
+            self.distance_m * (WALKING_DETOUR_FACTOR / WALKING_SPEED_M_PER_MIN), 2
+        )
+
+        self.resolve = lru_cache(maxsize=4096)(self._resolve)
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    def _resolve(self, text: Optional[str]) -> Optional[int]:
+        normalized = normalize_place_text(text)
+        if not normalized:
+            return None
+        exact = self._alias_to_id.get(normalized)
+        if exact is not None:
+            return exact
+        padded = f" {normalized} "
+        for alias in self._aliases_by_length:
+            if f" {alias} " in padded:
+                return self._alias_to_id[alias]
+        return None
+
+    def resolve_first(self, texts: Sequence[Optional[str]]) -> Optional[int]:
+        for text in texts:
+            place_id = self.resolve(text)
+            if place_id is not None:
+                return place_id
+        return None
+
+    def name(self, place_id: int) -> str:
+        return self.places[place_id].name
+
+    def position(self, place_id: int) -> LatLng:
+        return self.positions[place_id]
+
+    def distance_meters(self, a: int, b: int) -> float:
+        return float(self.distance_m[a, b])
+
+    def walking_minutes(self, a: int, b: int) -> float:
+        return float(self.walk_minutes[a, b])
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_DECODER = json.JSONDecoder()
+
+DEFAULT_CHUNK_CHARS = 64 * 1024
+
+
+class _ChunkReader:
+    """Character buffer over a text file that keeps only the unconsumed tail."""
+
+    def __init__(self, handle: Any, chunk_chars: int) -> None:
+        self._handle = handle
+        self._chunk_chars = chunk_chars
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read more text, growing the read as the pending value grows. False at EOF."""
+        if self.eof:
+            return False
+        if self.pos:
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+        chunk = self._handle.read(max(self._chunk_chars, len(self.buffer)))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it ("" at EOF)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in catalog, found {char or 'end of file'!r}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more text as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number followed only by number characters (e.g. "3" of "3.", or
+            # one ending the buffer) may continue in the next chunk.
+            if (
+                isinstance(value, (int, float))
+                and not self.eof
+                and all(char in _NUMBER_CHARS for char in self.buffer[end:])
+                and self.fill()
+            ):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_catalog_sellers(
+    path: Path,
+    key: str = "sellers",
+    chunk_chars: int = DEFAULT_CHUNK_CHARS,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the entries of the top-level ``key`` array of the JSON object in
+    ``path`` one at a time.
+
+    The file is read in chunks and each seller is decoded as soon as it is
+    complete, so memory is bounded by the largest single seller rather than
+    by the whole document.  Other top-level keys are decoded and discarded.
+    Raises ValueError (``json.JSONDecodeError`` included) on malformed input.
+    """
+    with open(path, "r", encoding="utf-8") as handle:
+        reader = _ChunkReader(handle, chunk_chars)
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+        while True:
+            name = reader.value()
+            if not isinstance(name, str):
+                raise ValueError("Catalog object keys must be strings")
+            reader.expect(":")
+            if name == key:
+                reader.expect("[")
+                if reader.peek() == "]":
+                    reader.pos += 1
+                else:
+                    while True:
+                        yield reader.value()
+                        if reader.expect(",]") == "]":
+                            break
+            else:
+                reader.value()
+            if reader.expect(",}") == "}":
+                return
+
+
+FileSignature = Tuple[int, int, int]
+
+
+def file_signature(path: Path) -> Optional[FileSignature]:
+    """``(mtime_ns, size, inode)`` of ``path``, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class CatalogWatcher:
+    """
+    Keeps an index derived from a catalog file current without involving
+    request handlers.
+
+    A background task polls the file's signature every ``interval_seconds``.
+    When it changes, ``build(previous)`` runs in a worker thread and its
+    result replaces :attr:`current` with a single reference swap, so readers
+    always see either the old or the new index in full and never touch the
+    file themselves.  A build returning None (unparseable file) keeps the
+    previous index until the file changes again.  ``on_publish(previous,
+    current)``, if given, runs on the event loop after each swap.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        build: Callable[[Any], Optional[Any]],
+        initial: Any,
+        interval_seconds: float = 2.0,
+        on_publish: Optional[Callable[[Any, Any], None]] = None,
+    ) -> None:
+        self.path = path
+        self.interval_seconds = interval_seconds
+        self.current = initial
+        self.reloads = 0
+        self._build = build
+        self._on_publish = on_publish
+        self._signature: Optional[FileSignature] = None
+        self._loaded = False
+        self._task: Optional[asyncio.Task] = None
+
+    async def refresh(self) -> bool:
+        """Rebuild if the file changed since the last build; True if a new index was published."""
+        signature = await asyncio.to_thread(file_signature, self.path)
+        if self._loaded and signature == self._signature:
+            return False
+        built = await asyncio.to_thread(self._build, self.current)
+        self._signature = signature
+        self._loaded = True
+        if built is None:
+            return False
+        previous, self.current = self.current, built
+        self.reloads += 1
+        if self._on_publish is not None:
+            self._on_publish(previous, built)
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.refresh()
+            except Exception as exc:  # keep watching after unexpected errors
+                print(f"[WARNING] Catalog reload of {self.path} failed: {exc}")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+def benchmark_load(
+    path: Path,
+    build_index: Callable[[Any], Any],
+    copies: int = 1,
+) -> Dict[str, Any]:
+    """
+    Compare ``json.load`` followed by an index build against streaming the
+    sellers straight into ``build_index``.  The catalog in ``path`` is
+    replicated ``copies`` times into a temporary file first, to simulate a
+    larger campus.  Reports load time and tracemalloc peak memory.
+    """
+    with open(path, "r", encoding="utf-8") as fh:
+        sellers = json.load(fh).get("sellers", [])
+
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as out:
+        out.write('{"sellers": [')
+        first = True
+        for copy_index in range(copies):
+            for seller in sellers:
+                if not first:
+                    out.write(",")
+                first = False
+                json.dump(dict(seller, user_id=f"{seller.get('user_id', 'seller')}_{copy_index}"), out)
+        out.write("]}")
+        catalog = Path(out.name)
+    del sellers
+
+    def measure(load: Callable[[], Any]) -> Tuple[float, float, Any]:
+        tracemalloc.start()
+        started = time.perf_counter()
+        result = load()
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return elapsed, peak, result
+
+    def load_whole() -> Any:
+        with open(catalog, "r", encoding="utf-8") as fh:
+            return build_index(json.load(fh).get("sellers", []))
+
+    try:
+        whole_seconds, whole_peak, whole_index = measure(load_whole)
+        del whole_index
+        stream_seconds, stream_peak, stream_index = measure(lambda: build_index(iter_catalog_sellers(catalog)))
+        return {
+            "catalogBytes": catalog.stat().st_size,
+            "listings": len(stream_index),
+            "jsonLoadSeconds": round(whole_seconds, 3),
+            "jsonLoadPeakMB": round(whole_peak / 2**20, 2),
+            "streamingSeconds": round(stream_seconds, 3),
+            "streamingPeakMB": round(stream_peak / 2**20, 2),
+        }
+    finally:
+        os.unlink(catalog)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from campus_gazetteer import DEFAULT_CAMPUS_PLACES, CampusGazetteer
+    from listings_index import ListingsIndex
+
+    gazetteer = CampusGazetteer(DEFAULT_CAMPUS_PLACES, center=(34.0689, -118.4452))
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    report = benchmark_load(
+        Path(__file__).resolve().parent / "campus_sellers.json",
+        lambda sellers: ListingsIndex(sellers, gazetteer),
+        copies=copies,
+    )
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Trips when an upstream dependency keeps failing or slowing down.
+
+    While closed, the outcome of the last ``window_size`` calls is kept; a
+    call counts as failed if it errored or took at least
+    ``slow_call_seconds``.  Once ``min_calls`` outcomes are known and the
+    failed share reaches ``failure_ratio``, the breaker opens and
+    :meth:`allow_request` refuses calls, so callers can fall back without
+    waiting on the dependency.  After ``open_seconds`` a single trial call is
+    let through (half-open): success closes the breaker, failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        window_size: int = 20,
+        min_calls: int = 5,
+        failure_ratio: float = 0.5,
+        slow_call_seconds: float = 10.0,
+        open_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_calls = min_calls
+        self.failure_ratio = failure_ratio
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._state = CLOSED
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+        self.trips += 1
+
+    def record(self, succeeded: bool, elapsed_seconds: float) -> None:
+        """Record the outcome of a call that :meth:`allow_request` let through."""
+        failed = not succeeded or elapsed_seconds >= self.slow_call_seconds
+        if self._state == HALF_OPEN:
+            self._trial_in_flight = False
+            if failed:
+                self._open()
+            else:
+                self._state = CLOSED
+            return
+        if self._state == OPEN:
+            # A call admitted before the breaker opened; the window restarts on close.
+            return
+        self._outcomes.append(failed)
+        if len(self._outcomes) >= self.min_calls:
+            if sum(self._outcomes) / len(self._outcomes) >= self.failure_ratio:
+                self._open()
+
+    def stats(self) -> Dict[str, Any]:
+        outcomes = len(self._outcomes)
+        return {
+            "state": self.state,
+            "windowCalls": outcomes,
+            "windowFailureRatio": round(sum(self._outcomes) / outcomes, 4) if outcomes else 0.0,
+            "trips": self.trips,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Set, Tuple
+
+
+EARTH_RADIUS_M = 6_371_000.0
+METERS_PER_DEGREE_LAT = 111_320.0
+
+# Average walking pace and a detour factor for paths that are not straight lines.
+WALKING_SPEED_M_PER_MIN = 80.0
+WALKING_DETOUR_FACTOR = 1.25
+
+LatLng = Tuple[float, float]
+
+
+def coerce_lat_lng(value: Any) -> Optional[LatLng]:
+    """Read a ``{"lat": .., "lng": ..}`` mapping, returning None if unusable."""
+    if not isinstance(value, dict):
+        return None
+    try:
+        lat = float(value.get("lat"))
+        lng = float(value.get("lng"))
+    except (TypeError, ValueError):
+        return None
+    if not (-90.0 <= lat <= 90.0 and -180.0 <= lng <= 180.0):
+        return None
+    return lat, lng
+
+
+def haversine_meters(a: LatLng, b: LatLng) -> float:
+    lat1, lng1 = map(math.radians, a)
+    lat2, lng2 = map(math.radians, b)
+    dlat = lat2 - lat1
+    dlng = lng2 - lng1
+    h = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlng / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(h)))
+
+
+def walking_minutes(meters: float) -> float:
+    return round(meters * WALKING_DETOUR_FACTOR / WALKING_SPEED_M_PER_MIN, 2)
+
+
+class SpatialGridIndex:
+    """
+    Uniform lat/lng grid for radius queries over point locations.
+
+    Points are bucketed into square cells roughly ``cell_size_m`` metres on a
+    side.  A radius query only visits the cells overlapping the query's
+    bounding box, so its cost depends on how many points are nearby rather
+    than on the total number of points indexed.  :meth:`copy` shares cell
+    sets with its source; either side copies a cell the first time it writes
+    to it, so an update costs the cells it touches.
+    """
+
+    def __init__(self, cell_size_m: float = 250.0) -> None:
+        if cell_size_m <= 0:
+            raise ValueError("cell_size_m must be positive")
+        self.cell_size_m = cell_size_m
+        self._cell_deg = cell_size_m / METERS_PER_DEGREE_LAT
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._positions: Dict[Hashable, LatLng] = {}
+        # Cells whose sets this instance may mutate in place.
+        self._owned: Set[Tuple[int, int]] = set()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._positions
+
+    def copy(self) -> "SpatialGridIndex":
+        clone = SpatialGridIndex(self.cell_size_m)
+        clone._cells = dict(self._cells)
+        clone._positions = dict(self._positions)
+        self._owned = set()
+        return clone
+
+    def _writable_cell(self, cell: Tuple[int, int]) -> Set[Hashable]:
+        if cell not in self._owned:
+            self._cells[cell] = set(self._cells.get(cell, ()))
+            self._owned.add(cell)
+        return self._cells[cell]
+
+    def _cell(self, point: LatLng) -> Tuple[int, int]:
+        return int(math.floor(point[0] / self._cell_deg)), int(math.floor(point[1] / self._cell_deg))
+
+    def position(self, key: Hashable) -> Optional[LatLng]:
+        return self._positions.get(key)
+
+    def add(self, key: Hashable, point: LatLng) -> None:
+        self.remove(key)
+        self._positions[key] = point
+        self._writable_cell(self._cell(point)).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        point = self._positions.pop(key, None)
+        if point is None:
+            return
+        cell = self._cell(point)
+        members = self._cells.get(cell)
+        if members is None:
+            return
+        if len(members) == 1:
+            del self._cells[cell]
+            self._owned.discard(cell)
+        else:
+            self._writable_cell(cell).discard(key)
+
+    def _cells_near(self, center: LatLng, radius_m: float) -> Iterator[Set[Hashable]]:
+        lat_span = radius_m / METERS_PER_DEGREE_LAT
+        cos_lat = max(math.cos(math.radians(center[0])), 1e-6)
+        lng_span = min(radius_m / (METERS_PER_DEGREE_LAT * cos_lat), 180.0)
+        min_row, min_col = self._cell((center[0] - lat_span, center[1] - lng_span))
+        max_row, max_col = self._cell((center[0] + lat_span, center[1] + lng_span))
+        if (max_row - min_row + 1) * (max_col - min_col + 1) > len(self._cells):
+            # The box covers more cells than are occupied: walk the occupied ones.
+            for (row, col), members in self._cells.items():
+                if min_row <= row <= max_row and min_col <= col <= max_col:
+                    yield members
+            return
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                members = self._cells.get((row, col))
+                if members:
+                    yield members
+
+    def within(self, center: LatLng, radius_m: float) -> List[Tuple[Hashable, float]]:
+        """Return ``(key, metres)`` pairs within ``radius_m`` of ``center``, nearest first."""
+        hits: List[Tuple[Hashable, float]] = []
+        for members in self._cells_near(center, radius_m):
+            for key in members:
+                meters = haversine_meters(center, self._positions[key])
+                if meters <= radius_m:
+                    hits.append((key, meters))
+        hits.sort(key=lambda pair: pair[1])
+        return hits
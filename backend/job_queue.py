@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class Job:
+    """State of one background job; timestamps are ``time.monotonic`` values."""
+
+    __slots__ = (
+        "job_id",
+        "state",
+        "attempts",
+        "error",
+        "created_at",
+        "submitted",
+        "started",
+        "finished",
+        "work",
+    )
+
+    def __init__(self, job_id: str, work: Callable[[], Awaitable[Any]]) -> None:
+        self.job_id = job_id
+        self.work = work
+        self.state = QUEUED
+        self.attempts = 0
+        self.error: Optional[str] = None
+        self.created_at = datetime.utcnow().isoformat()
+        self.submitted = time.monotonic()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "jobId": self.job_id,
+            "status": self.state,
+            "attempts": self.attempts,
+            "error": self.error,
+            "createdAt": self.created_at,
+            "latencySeconds": round(self.finished - self.submitted, 3) if self.finished else None,
+        }
+
+
+class JobQueue:
+    """
+    Bounded in-process queue of background jobs run by a fixed number of
+    worker tasks.
+
+    :meth:`submit` raises ``asyncio.QueueFull`` once ``max_queued`` jobs are
+    waiting, so callers can apply backpressure.  A job whose work raises is
+    retried up to ``max_attempts`` times with exponential backoff starting
+    at ``retry_base_seconds``, unless ``should_retry`` rejects the error.
+    Job states stay queryable by id until more than ``keep_finished`` jobs
+    have finished after them.  Queue depth and job latency (from
+    submission to completion) are reported by :meth:`stats`.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 2,
+        max_queued: int = 100,
+        max_attempts: int = 3,
+        retry_base_seconds: float = 1.0,
+        should_retry: Callable[[BaseException], bool] = lambda exc: True,
+        keep_finished: int = 1000,
+    ) -> None:
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self._should_retry = should_retry
+        self._keep_finished = keep_finished
+        self._queue: "asyncio.Queue[Job]" = asyncio.Queue(maxsize=max_queued)
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._workers: List[asyncio.Task] = []
+        self._latencies: Deque[float] = deque(maxlen=500)
+        self.running = 0
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.retries = 0
+
+    def submit(self, job_id: str, work: Callable[[], Awaitable[Any]]) -> Job:
+        job = Job(job_id, work)
+        self._queue.put_nowait(job)
+        self._jobs[job_id] = job
+        self._jobs.move_to_end(job_id)
+        self.submitted += 1
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    async def _run(self, job: Job) -> None:
+        job.state = RUNNING
+        job.started = time.monotonic()
+        self.running += 1
+        try:
+            while True:
+                job.attempts += 1
+                try:
+                    await job.work()
+                except Exception as exc:
+                    job.error = str(exc) or type(exc).__name__
+                    if job.attempts >= self.max_attempts or not self._should_retry(exc):
+                        job.state = FAILED
+                        self.failed += 1
+                        break
+                    self.retries += 1
+                    await asyncio.sleep(self.retry_base_seconds * 2 ** (job.attempts - 1))
+                else:
+                    job.state = SUCCEEDED
+                    job.error = None
+                    self.succeeded += 1
+                    break
+        finally:
+            self.running -= 1
+            job.finished = time.monotonic()
+            job.work = None
+            self._latencies.append(job.finished - job.submitted)
+            self._forget_finished()
+
+    def _forget_finished(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished is not None]
+        for job_id in finished[: max(len(finished) - self._keep_finished, 0)]:
+            del self._jobs[job_id]
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            except Exception as exc:  # keep the worker alive
+                print(f"[WARNING] Background job {job.job_id} crashed: {exc}")
+            finally:
+                self._queue.task_done()
+
+    def start(self) -> None:
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def stop(self, drain_seconds: float = 5.0) -> None:
+        """Give queued jobs ``drain_seconds`` to finish, then cancel the workers."""
+        if not self._workers:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=drain_seconds)
+        except asyncio.TimeoutError:
+            pass
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+
+        def percentile(fraction: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(int(fraction * len(latencies)), len(latencies) - 1)], 3)
+
+        return {
+            "queueDepth": self._queue.qsize(),
+            "maxQueued": self._queue.maxsize,
+            "running": self.running,
+            "workers": len(self._workers),
+            "submitted": self.submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "retries": self.retries,
+            "latencyP50Seconds": percentile(0.5),
+            "latencyP95Seconds": percentile(0.95),
+        }
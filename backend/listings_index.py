@@ -0,0 +1,634 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import math
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from autocomplete import SuggestionIndex
+from campus_gazetteer import CampusGazetteer
+
+
+def normalize_category(category: str) -> str:
+    """Normalize backend category to frontend category."""
+    if not category:
+        return "Other"
+    category_lower = category.lower().replace("_", " ")
+    if "textbook" in category_lower:
+        return "Textbooks"
+    elif "electronic" in category_lower:
+        return "Electronics"
+    elif "cloth" in category_lower:
+        return "Clothing"
+    elif "food" in category_lower or "snack" in category_lower:
+        return "Food"
+    elif "furniture" in category_lower or "furnish" in category_lower:
+        return "Furniture"
+    else:
+        return "Other"
+
+
+def get_category_emoji(category: str) -> str:
+    """Get emoji based on category."""
+    category_lower = category.lower()
+    if "textbook" in category_lower:
+        return "📚"
+    elif "electronic" in category_lower:
+        return "💻"
+    elif "cloth" in category_lower:
+        return "👕"
+    elif "food" in category_lower:
+        return "🍕"
+    elif "furniture" in category_lower:
+        return "🪑"
+    else:
+        return "📦"
+
+
+def seller_total_items_sold(seller: Dict[str, Any]) -> int:
+    return sum(
+        s.get("total_items_sold", 0)
+        for s in seller.get("sales_history_summary", [])
+    )
+
+
+def calculate_seller_badges(seller: Dict[str, Any], total_items_sold: Optional[int] = None) -> List[str]:
+    """Calculate badges for a seller based on their stats."""
+    badges = []
+
+    # Verified Student - if seller has a rating, consider them verified
+    if seller.get("seller_rating_avg", 0) > 0:
+        badges.append("Verified Student")
+
+    # Top Seller - if total items sold > 20
+    if total_items_sold is None:
+        total_items_sold = seller_total_items_sold(seller)
+    if total_items_sold > 20:
+        badges.append("Top Seller")
+
+    # Campus Leader - if trust score > 90
+    # Calculate trust score: base 70 + up to 25 based on rating + items sold
+    rating = seller.get("seller_rating_avg", 0)
+    trust_score = min(95, 70 + min(15, (rating - 3) * 5) + min(10, total_items_sold // 5))
+    if trust_score > 90:
+        badges.append("Campus Leader")
+
+    return badges
+
+
+def calculate_trust_score(seller: Dict[str, Any], total_items_sold: Optional[int] = None) -> int:
+    """Calculate trust score for a seller."""
+    rating = seller.get("seller_rating_avg", 0)
+    if total_items_sold is None:
+        total_items_sold = seller_total_items_sold(seller)
+    # Base score 70, add up to 15 for rating, up to 10 for volume
+    return min(95, 70 + min(15, int((rating - 3) * 5)) + min(10, total_items_sold // 5))
+
+
+class SellerStats(NamedTuple):
+    """Derived per-seller values shared by all of a seller's listings."""
+
+    user_id: str
+    name: str
+    major: str
+    rating: float
+    total_items_sold: int
+    trust_score: int
+    badges: Tuple[str, ...]
+    verified: bool
+    primary_location: str
+
+    def card(self) -> Dict[str, Any]:
+        """The seller card embedded as ``owner`` in every listing."""
+        return {
+            "id": self.user_id,
+            "name": self.name,
+            "major": self.major,
+            "dorm": self.primary_location,
+            "rating": self.rating,
+            "verified": self.verified,
+            "trustScore": self.trust_score,
+            "pastTrades": self.total_items_sold,
+            "badges": list(self.badges),
+        }
+
+
+def compute_seller_stats(seller: Dict[str, Any]) -> SellerStats:
+    total_items_sold = seller_total_items_sold(seller)
+    seller_rating = seller.get("seller_rating_avg", 0)
+    location_keywords = seller.get("inferred_location_keywords", [])
+    return SellerStats(
+        user_id=seller.get("user_id", ""),
+        name=seller.get("full_name", "Unknown Seller"),
+        major=seller.get("inferred_major", "Undeclared"),
+        rating=round(seller_rating, 2) if seller_rating else 0.0,
+        total_items_sold=total_items_sold,
+        trust_score=calculate_trust_score(seller, total_items_sold),
+        badges=tuple(calculate_seller_badges(seller, total_items_sold)),
+        verified=seller_rating > 0,
+        primary_location=location_keywords[0] if location_keywords else "Campus",
+    )
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Relative weight of a term occurrence in each searchable listing field.
+SEARCH_FIELD_WEIGHTS: Tuple[Tuple[str, float], ...] = (
+    ("title", 3.0),
+    ("condition", 1.0),
+    ("description", 1.0),
+)
+# A query token that only matches as a prefix of an indexed term ("calc" for
+# "calculus") scores this fraction of an exact match.
+PREFIX_MATCH_WEIGHT = 0.5
+
+
+def tokenize_search_text(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    return _TOKEN_RE.findall(str(text).lower())
+
+
+# Price facet buckets as ``(label, low, high)``; a bucket holds low <= price < high.
+PRICE_BUCKETS: Tuple[Tuple[str, float, float], ...] = (
+    ("Under $25", 0.0, 25.0),
+    ("$25-$50", 25.0, 50.0),
+    ("$50-$100", 50.0, 100.0),
+    ("$100+", 100.0, math.inf),
+)
+FACET_FIELDS: Tuple[str, ...] = ("category", "priceBucket", "condition", "verified")
+
+
+# Day number stored for listings without a parseable posting date.
+MISSING_DATE_DAYS = -1
+
+
+def price_bucket(price: float) -> int:
+    """Index into PRICE_BUCKETS of the bucket holding ``price``."""
+    for index, (_, low, high) in enumerate(PRICE_BUCKETS):
+        if low <= price < high:
+            return index
+    return 0
+
+
+def date_days(value: Any) -> int:
+    """Days since 1970-01-01 of an ISO ``YYYY-MM-DD[...]`` date string."""
+    try:
+        return (date.fromisoformat(str(value)[:10]) - date(1970, 1, 1)).days
+    except ValueError:
+        return MISSING_DATE_DAYS
+
+
+# Sort modes of /api/listings.  Every mode breaks ties newest first (by posting
+# day, then by load order); all but "relevance" (which ranks search hits) have
+# a permutation built at load time.
+SORT_NEWEST = "newest"
+SORT_RELEVANCE = "relevance"
+SORT_MODES: Tuple[str, ...] = (SORT_NEWEST, "price_asc", "price_desc", "trust", "rating", SORT_RELEVANCE)
+
+
+class ListingsPage(NamedTuple):
+    listings: List[Dict[str, Any]]
+    total: int
+    next_cursor: Optional[str]
+    facets: Dict[str, Dict[str, int]]
+
+
+def encode_listings_cursor(payload: Dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_listings_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode an opaque page cursor, raising ValueError if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("Malformed listings cursor") from exc
+    if (
+        not isinstance(payload, dict)
+        or payload.get("o") not in SORT_MODES
+        or not isinstance(payload.get("d"), str)
+        or not isinstance(payload.get("i"), str)
+        or not isinstance(payload.get("k"), list)
+        or not all(isinstance(key, (int, float)) for key in payload["k"])
+    ):
+        raise ValueError("Malformed listings cursor")
+    return payload
+
+
+def listing_price_value(price: Any) -> float:
+    """Numeric price the price filters and sorts compare; display rounding is applied separately."""
+    return float(price) if price else 0.0
+
+
+class ListingsIndex:
+    """
+    Read-only, prebuilt view of the campus listings catalog.
+
+    Every listing is formatted into its API shape exactly once, when the
+    catalog file is (re)loaded, and kept in newest-first order.  Ties on the
+    posting date are broken by listing id, which makes the order total and
+    lets pages resume from a keyset cursor.
+
+    The fields queries look at are stored column-wise in NumPy arrays
+    indexed by listing position: price, posting day, category / condition /
+    price-bucket / campus-place codes, verified flag, trust score and seller
+    index.  A query turns each filter into a boolean mask, ANDs the masks and
+    reads the total and the facet counts (``np.bincount`` of the code
+    columns) off the result; price ranges come from a binary search over a
+    price-sorted permutation.  Each sort mode owns a permutation of the
+    positions and its ascending sort-key matrix, both built at load time; a
+    sorted page is read by walking that permutation through the filter mask,
+    without sorting per request.  Free-text search goes through an inverted
+    index over the title, condition and description tokens, and type-ahead
+    suggestions come from a prefix index over titles, categories, seller
+    majors and locations.  Only the listings of the returned page are
+    touched as dicts; they are shared, so callers must treat them as
+    immutable.
+    """
+
+    def __init__(
+        self,
+        sellers: Iterable[Dict[str, Any]],
+        gazetteer: CampusGazetteer,
+        generation: int = 0,
+        mtime: Optional[float] = None,
+    ) -> None:
+        self.generation = generation
+        self.mtime = mtime
+        self._gazetteer = gazetteer
+
+        rows = []
+        # Seller stats table, indexed by the seller column.
+        self.sellers: List[SellerStats] = []
+        self._seller_ids: Dict[str, int] = {}
+        self._seller_listing_counts: List[int] = []
+        # (kind, text) -> popularity, for the autocomplete index.
+        suggestion_counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        for seller in sellers:
+            seller_listings = seller.get("current_item_listings", [])
+            if not seller_listings:
+                continue
+            seller_index = len(self.sellers)
+            stats = compute_seller_stats(seller)
+            self.sellers.append(stats)
+            self._seller_ids.setdefault(stats.user_id, seller_index)
+            self._seller_listing_counts.append(len(seller_listings))
+            seller_location = stats.primary_location
+            # One owner card shared by every listing of the seller.
+            owner = stats.card()
+            suggestion_counts[("major", stats.major)] += len(seller_listings)
+            for keyword in seller.get("inferred_location_keywords", []):
+                suggestion_counts[("location", keyword)] += 1
+
+            for listing_index, listing in enumerate(seller_listings):
+                listing_location = listing.get("location", "") or seller_location
+                price = listing.get("price", 0)
+                formatted = {
+                    "id": f"{seller.get('user_id', 'unknown')}-{listing.get('parsed_item', 'item')}-{listing_index}-{listing.get('date_posted', '')}",
+                    "title": listing.get("parsed_item", "Item"),
+                    "category": normalize_category(listing.get("category", "Other")),
+                    "price": f"${int(price)}" if price else "$0",
+                    "photo": get_category_emoji(listing.get("category", "Other")),
+                    "condition": listing.get("condition", ""),
+                    "description": listing.get("description", ""),
+                    "location": listing_location,
+                    "lastActive": listing.get("date_posted", ""),
+                    "owner": owner,
+                }
+                rows.append((formatted, listing_price_value(price), gazetteer.resolve(listing_location), seller_index))
+                suggestion_counts[("title", formatted["title"])] += 1
+                suggestion_counts[("category", formatted["category"])] += 1
+                suggestion_counts[("location", listing_location)] += 1
+
+        self.autocomplete = SuggestionIndex(
+            (kind, text, count) for (kind, text), count in suggestion_counts.items()
+        )
+
+        # Newest first, then by id: sort by the tie-breaker first and rely on
+        # the stable sort for the primary key.
+        rows.sort(key=lambda row: row[0]["id"])
+        rows.sort(key=lambda row: row[0]["lastActive"], reverse=True)
+
+        self.listings: List[Dict[str, Any]] = [row[0] for row in rows]
+        count = len(rows)
+
+        self._price = np.fromiter((row[1] for row in rows), dtype=np.float64, count=count)
+        self._date_days = np.fromiter(
+            (date_days(listing["lastActive"]) for listing in self.listings), dtype=np.int32, count=count
+        )
+        self._seller = np.fromiter((row[3] for row in rows), dtype=np.int32, count=count)
+        # Seller-level columns are gathered from the stats table.
+        self._verified = np.array([stats.verified for stats in self.sellers], dtype=bool)[self._seller]
+        self._trust = np.array([stats.trust_score for stats in self.sellers], dtype=np.int16)[self._seller]
+        self._rating = np.array([stats.rating for stats in self.sellers], dtype=np.float64)[self._seller]
+        self._place = np.fromiter(
+            (-1 if row[2] is None else row[2] for row in rows), dtype=np.int16, count=count
+        )
+        self._price_order = np.argsort(self._price, kind="stable")
+        self._price_sorted = self._price[self._price_order]
+
+        # Facet columns hold codes into their value lists; -1 means "no value".
+        self._facet_values: Dict[str, List[str]] = {
+            "category": [],
+            "priceBucket": [label for label, _, _ in PRICE_BUCKETS],
+            "condition": [],
+            "verified": ["true", "false"],
+        }
+        self._facet_codes: Dict[str, Dict[str, int]] = {
+            field: {value: code for code, value in enumerate(values)}
+            for field, values in self._facet_values.items()
+        }
+
+        def encode(field: str, value: str) -> int:
+            if not value:
+                return -1
+            codes = self._facet_codes[field]
+            if value not in codes:
+                codes[value] = len(self._facet_values[field])
+                self._facet_values[field].append(value)
+            return codes[value]
+
+        self._facets: Dict[str, np.ndarray] = {
+            "category": np.fromiter(
+                (encode("category", listing["category"]) for listing in self.listings), dtype=np.int16, count=count
+            ),
+            "priceBucket": np.fromiter(
+                (price_bucket(price) for price in self._price), dtype=np.int16, count=count
+            ),
+            "condition": np.fromiter(
+                (encode("condition", listing["condition"].lower()) for listing in self.listings),
+                dtype=np.int16,
+                count=count,
+            ),
+            "verified": np.where(self._verified, 0, 1).astype(np.int16),
+        }
+
+        self._build_search_index()
+        self._build_sort_orders()
+
+    def __len__(self) -> int:
+        return len(self.listings)
+
+    def seller_card(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Seller card plus listing count from the stats table, or None for an unknown seller."""
+        seller_index = self._seller_ids.get(user_id)
+        if seller_index is None:
+            return None
+        return {**self.sellers[seller_index].card(), "listingCount": self._seller_listing_counts[seller_index]}
+
+    def added_since(self, previous: "ListingsIndex") -> Iterator[Tuple[Dict[str, Any], float]]:
+        """Listings (with their numeric price) whose ids are not in ``previous``."""
+        known = {listing["id"] for listing in previous.listings}
+        for position, listing in enumerate(self.listings):
+            if listing["id"] not in known:
+                yield listing, float(self._price[position])
+
+    def _build_sort_orders(self) -> None:
+        # Ascending sort keys per mode, most significant first (descending
+        # fields are negated).  Every mode ends with the negated posting day,
+        # and the position itself is the final tie-breaker, which keeps
+        # listings posted the same day in load order.
+        price = self._price
+        trust = self._trust.astype(np.float64)
+        rating = self._rating
+        newest = -self._date_days.astype(np.float64)
+        key_columns: Dict[str, List[np.ndarray]] = {
+            SORT_NEWEST: [newest],
+            "price_asc": [price, newest],
+            "price_desc": [-price, newest],
+            "trust": [-trust, -rating, newest],
+            "rating": [-rating, -trust, newest],
+        }
+        positions = np.arange(len(self.listings))
+        self._orders: Dict[str, np.ndarray] = {}
+        self._sort_keys: Dict[str, np.ndarray] = {}
+        for mode, columns in key_columns.items():
+            self._orders[mode] = np.lexsort((positions, *reversed(columns)))
+            self._sort_keys[mode] = np.column_stack(columns)
+
+    def _build_search_index(self) -> None:
+        # term -> [(position, weight)] in ascending position order.
+        postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+        for position, listing in enumerate(self.listings):
+            weights: Dict[str, float] = defaultdict(float)
+            for field, field_weight in SEARCH_FIELD_WEIGHTS:
+                for term in tokenize_search_text(listing[field]):
+                    weights[term] += field_weight
+            for term, weight in weights.items():
+                postings[term].append((position, weight))
+
+        count = len(self.listings)
+        self._postings: Dict[str, List[Tuple[int, float]]] = dict(postings)
+        self._idf: Dict[str, float] = {
+            term: math.log(1.0 + count / len(entries)) for term, entries in self._postings.items()
+        }
+        # Sorted vocabulary for prefix expansion.
+        self._terms: List[str] = sorted(self._postings)
+
+    def _expand_term(self, token: str) -> List[str]:
+        start = bisect_left(self._terms, token)
+        end = bisect_left(self._terms, token + "\uffff", start)
+        return self._terms[start:end]
+
+    def search(self, text: Optional[str]) -> Dict[int, float]:
+        """
+        Score listings against the tokens of ``text``.  Every token must
+        match a listing term exactly or as a prefix; the postings of all
+        tokens are intersected and each hit's score sums its per-token
+        tf-idf weights.  Returns ``{position: score}``; text without any
+        searchable tokens matches nothing.
+        """
+        tokens = list(dict.fromkeys(tokenize_search_text(text)))
+        if not tokens:
+            return {}
+
+        token_hits: List[Dict[int, float]] = []
+        for token in tokens:
+            hits: Dict[int, float] = {}
+            for term in self._expand_term(token):
+                factor = self._idf[term] * (1.0 if term == token else PREFIX_MATCH_WEIGHT)
+                for position, weight in self._postings[term]:
+                    score = weight * factor
+                    if score > hits.get(position, 0.0):
+                        hits[position] = score
+            if not hits:
+                return {}
+            token_hits.append(hits)
+
+        # Intersect starting from the rarest token.
+        token_hits.sort(key=len)
+        scores = token_hits[0]
+        for hits in token_hits[1:]:
+            scores = {position: score + hits[position] for position, score in scores.items() if position in hits}
+            if not scores:
+                break
+        return scores
+
+    def _positions_mask(self, positions: Iterable[int]) -> np.ndarray:
+        mask = np.zeros(len(self.listings), dtype=bool)
+        mask[np.fromiter(positions, dtype=np.int64)] = True
+        return mask
+
+    def _facet_mask(self, field: str, value: str) -> np.ndarray:
+        code = self._facet_codes[field].get(value)
+        if code is None:
+            return np.zeros(len(self.listings), dtype=bool)
+        return self._facets[field] == code
+
+    def _price_range(self, price_min: Optional[float], price_max: Optional[float]) -> np.ndarray:
+        """Mask of the listings priced within ``[price_min, price_max]``."""
+        start = 0 if price_min is None else int(np.searchsorted(self._price_sorted, price_min, side="left"))
+        end = len(self._price_sorted) if price_max is None else int(
+            np.searchsorted(self._price_sorted, price_max, side="right")
+        )
+        return self._positions_mask(self._price_order[start:end])
+
+    def _walkable_from(self, near_place: int, max_walk_minutes: float) -> np.ndarray:
+        # One extra False slot so listings without a place (code -1) never match.
+        walkable = np.append(self._gazetteer.walk_minutes[near_place] <= max_walk_minutes, False)
+        return walkable[self._place]
+
+    def _intersect(self, masks: Iterable[np.ndarray]) -> np.ndarray:
+        result = np.ones(len(self.listings), dtype=bool)
+        for mask in masks:
+            result &= mask
+        return result
+
+    def _facet_counts(self, filters: Dict[str, np.ndarray]) -> Dict[str, Dict[str, int]]:
+        """
+        Count every facet value under all filters except the facet's own, so
+        a selected category still reports how many listings the others hold.
+        """
+        counts: Dict[str, Dict[str, int]] = {}
+        for field, values in self._facet_values.items():
+            base = self._intersect(mask for name, mask in filters.items() if name != field)
+            codes = self._facets[field][base]
+            tally = np.bincount(codes[codes >= 0], minlength=len(values))
+            counts[field] = dict(zip(values, tally.tolist()))
+        return counts
+
+    def _comes_after(self, position: int, date: str, listing_id: str) -> bool:
+        """Whether ``position`` sorts after the listing keyed ``(date, listing_id)``."""
+        listing = self.listings[position]
+        return listing["lastActive"] < date or (
+            listing["lastActive"] == date and listing["id"] > listing_id
+        )
+
+    def _first_after(
+        self,
+        order: Sequence[int],
+        keys: Callable[[int], List[float]],
+        after: Dict[str, Any],
+    ) -> int:
+        """Index of the first entry of ``order`` that sorts after the cursor ``after``."""
+        after_keys = after["k"]
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            position = int(order[middle])
+            position_keys = keys(position)
+            if position_keys > after_keys or (
+                position_keys == after_keys and self._comes_after(position, after["d"], after["i"])
+            ):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def _cursor_for(self, mode: str, position: int, keys: List[float]) -> str:
+        listing = self.listings[position]
+        return encode_listings_cursor({"o": mode, "k": keys, "d": listing["lastActive"], "i": listing["id"]})
+
+    def query(
+        self,
+        search: Optional[str] = None,
+        category: Optional[str] = None,
+        condition: Optional[str] = None,
+        price_min: Optional[float] = None,
+        price_max: Optional[float] = None,
+        verified_only: bool = False,
+        near_place: Optional[int] = None,
+        max_walk_minutes: Optional[float] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> ListingsPage:
+        """
+        Return one page of matching listings, the total number of matches,
+        the cursor of the next page (None on the last page) and the facet
+        counts of the filtered set.
+
+        ``sort`` is one of SORT_MODES and defaults to relevance for searches
+        and newest first otherwise; relevance without a search is newest
+        first.  Pages resume after the cursor by binary search over the
+        mode's order, so deep pages cost no more than the first one.  Raises
+        ValueError for an unknown ``sort`` or a malformed or mismatched
+        ``cursor``.
+        """
+        scores = self.search(search) if search else None
+        mode = sort or (SORT_RELEVANCE if scores is not None else SORT_NEWEST)
+        if mode not in SORT_MODES:
+            raise ValueError(f"Unknown sort {sort!r}; expected one of {', '.join(SORT_MODES)}")
+        if mode == SORT_RELEVANCE and scores is None:
+            mode = SORT_NEWEST
+        after = decode_listings_cursor(cursor) if cursor else None
+        if after is not None and after["o"] != mode:
+            raise ValueError("Cursor belongs to a different sort order")
+
+        # Filters keyed by the facet they constrain, so facet counts can
+        # leave out their own filter.
+        filters: Dict[str, np.ndarray] = {}
+        if scores is not None:
+            filters["search"] = self._positions_mask(scores)
+        if category and category != "All":
+            filters["category"] = self._facet_mask("category", category)
+        if condition:
+            filters["condition"] = self._facet_mask("condition", condition.lower())
+        if verified_only:
+            filters["verified"] = self._verified
+        if price_min is not None or price_max is not None:
+            filters["priceBucket"] = self._price_range(price_min, price_max)
+        if near_place is not None and max_walk_minutes is not None:
+            filters["near"] = self._walkable_from(near_place, max_walk_minutes)
+
+        mask = self._intersect(filters.values())
+        total = int(np.count_nonzero(mask))
+        facets = self._facet_counts(filters)
+
+        if mode == SORT_RELEVANCE:
+            selected = np.flatnonzero(mask)
+            score_column = np.fromiter((scores[position] for position in selected.tolist()), dtype=np.float64)
+            day_column = self._date_days[selected]
+            order: np.ndarray = selected[np.lexsort((selected, -day_column, -score_column))]
+
+            def keys(position: int) -> List[float]:
+                return [-scores[position], -float(self._date_days[position])]
+
+            begin = self._first_after(order, keys, after) if after else 0
+            ordered = order[begin:]
+        else:
+            order = self._orders[mode]
+            sort_keys = self._sort_keys[mode]
+
+            def keys(position: int) -> List[float]:
+                return sort_keys[position].tolist()
+
+            begin = self._first_after(order, keys, after) if after else 0
+            remaining = order[begin:]
+            ordered = remaining[mask[remaining]]
+
+        page = (ordered if limit is None else ordered[:limit]).tolist()
+        next_cursor = None
+        if page and len(page) < len(ordered):
+            next_cursor = self._cursor_for(mode, page[-1], keys(page[-1]))
+        return ListingsPage([self.listings[position] for position in page], total, next_cursor, facets)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import re
+import zlib
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Each band's buckets are spread over this many shard dicts (a power of two),
+# so a copy-on-write update copies one small shard instead of the whole band.
+BUCKET_SHARDS = 256
+
+
+def char_ngrams(text: Optional[str], n: int = 3) -> Set[str]:
+    """Lowercased, whitespace-collapsed character n-grams of ``text``."""
+    if not text:
+        return set()
+    cleaned = _WHITESPACE_RE.sub(" ", str(text).lower()).strip()
+    if not cleaned:
+        return set()
+    if len(cleaned) <= n:
+        return {cleaned}
+    return {cleaned[i : i + n] for i in range(len(cleaned) - n + 1)}
+
+
+class MinHashLSHIndex:
+    """
+    Approximate nearest-neighbour index over free text.
+
+    Each key is indexed as one or more short passages (a seller's bio, each
+    item example, ...) so that short queries are compared against text of a
+    similar length.  Every passage is reduced to its set of hashed character
+    n-grams and summarised by a MinHash signature of ``bands * rows``
+    permutations.  The signature is split into ``bands`` bands; passages
+    sharing any band land in the same bucket and their keys become
+    candidates.  Candidates are ranked by the best fraction of agreeing
+    signature slots across their passages, which estimates the Jaccard
+    similarity of the underlying n-gram sets.  A passage pair with Jaccard
+    similarity ``s`` becomes a candidate with probability
+    ``1 - (1 - s**rows)**bands``; the defaults (20 bands of 4 rows) put the
+    threshold of that S-curve near ``(1/bands)**(1/rows)``, about 0.47.
+
+    Lookups touch one bucket per probed band, so query cost depends on the
+    number of similar documents rather than on the size of the index.  The
+    ``probe_bands`` argument of :meth:`query` is the recall/speed knob:
+    probing fewer bands inspects fewer buckets and returns fewer, more
+    similar, candidates.
+
+    :meth:`copy` is copy-on-write: buckets live in sharded dicts, a copy
+    shares every shard with its source, and the first write to a shard after
+    a copy replaces just that shard, while writes to a bucket in such a shard
+    replace the bucket rather than mutate it.  Writes therefore cost what they
+    touch rather than the size of the index.
+    """
+
+    def __init__(self, bands: int = 20, rows: int = 4, ngram: int = 3, seed: int = 1) -> None:
+        if bands <= 0 or rows <= 0:
+            raise ValueError("bands and rows must be positive")
+        self.bands = bands
+        self.rows = rows
+        self.ngram = ngram
+        self.num_perm = bands * rows
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 31, size=self.num_perm, dtype=np.int64).astype(np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=self.num_perm, dtype=np.int64).astype(np.uint64)
+        # One (passages, num_perm) matrix per key.
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+        self._buckets: List[List[Dict[bytes, Set[Hashable]]]] = [
+            [{} for _ in range(BUCKET_SHARDS)] for _ in range(bands)
+        ]
+        # Shards built by this instance: the dict and its buckets are private.
+        self._private: Set[Tuple[int, int]] = {
+            (band, shard) for band in range(bands) for shard in range(BUCKET_SHARDS)
+        }
+        # Shards copied after a copy(): the dict is private, its buckets are shared.
+        self._copied: Set[Tuple[int, int]] = set()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._signatures
+
+    def copy(self) -> "MinHashLSHIndex":
+        """Independent copy; shards are shared until either side writes to them."""
+        clone = object.__new__(MinHashLSHIndex)
+        clone.bands = self.bands
+        clone.rows = self.rows
+        clone.ngram = self.ngram
+        clone.num_perm = self.num_perm
+        clone._a = self._a
+        clone._b = self._b
+        clone._signatures = dict(self._signatures)
+        clone._buckets = [list(shards) for shards in self._buckets]
+        clone._private = set()
+        clone._copied = set()
+        # Shards are shared now, so this instance must copy before writing too.
+        self._private = set()
+        self._copied = set()
+        return clone
+
+    def _shard(self, band: int, band_key: bytes) -> Dict[bytes, Set[Hashable]]:
+        return self._buckets[band][hash(band_key) & (BUCKET_SHARDS - 1)]
+
+    def _writable_shard(self, band: int, band_key: bytes) -> Tuple[Dict[bytes, Set[Hashable]], bool]:
+        """The shard holding ``band_key``, copied if shared, and whether its buckets are private."""
+        index = (band, hash(band_key) & (BUCKET_SHARDS - 1))
+        if index in self._private:
+            return self._buckets[band][index[1]], True
+        if index not in self._copied:
+            self._buckets[band][index[1]] = dict(self._buckets[band][index[1]])
+            self._copied.add(index)
+        return self._buckets[band][index[1]], False
+
+    def signature(self, text: Optional[str]) -> Optional[np.ndarray]:
+        shingles = char_ngrams(text, self.ngram)
+        if not shingles:
+            return None
+        hashed = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        permuted = (np.outer(self._a, hashed) + self._b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> Iterable[Tuple[int, bytes]]:
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, signature[start : start + self.rows].tobytes()
+
+    def signatures(self, passages: Iterable[Optional[str]]) -> List[np.ndarray]:
+        """Signatures of the non-empty ``passages``; pure, so callers may compute them outside locks."""
+        return [
+            signature
+            for signature in (self.signature(passage) for passage in passages)
+            if signature is not None
+        ]
+
+    def add(self, key: Hashable, passages: Iterable[Optional[str]]) -> bool:
+        """Index ``passages`` under ``key``, replacing any previous entry."""
+        return self.add_signatures(key, self.signatures(passages))
+
+    def add_signatures(self, key: Hashable, signatures: List[np.ndarray]) -> bool:
+        """Index precomputed :meth:`signatures` under ``key``, replacing any previous entry."""
+        self.remove(key)
+        if not signatures:
+            return False
+        self._signatures[key] = np.stack(signatures)
+        for signature in signatures:
+            for band, band_key in self._band_keys(signature):
+                shard, private = self._writable_shard(band, band_key)
+                bucket = shard.get(band_key)
+                if bucket is None:
+                    shard[band_key] = {key}
+                elif private:
+                    bucket.add(key)
+                else:
+                    shard[band_key] = bucket | {key}
+        return True
+
+    def remove(self, key: Hashable) -> None:
+        signatures = self._signatures.pop(key, None)
+        if signatures is None:
+            return
+        for signature in signatures:
+            for band, band_key in self._band_keys(signature):
+                bucket = self._shard(band, band_key).get(band_key)
+                if bucket is None or key not in bucket:
+                    continue
+                shard, private = self._writable_shard(band, band_key)
+                if len(bucket) == 1:
+                    del shard[band_key]
+                elif private:
+                    bucket.discard(key)
+                else:
+                    shard[band_key] = bucket - {key}
+
+    def query(
+        self,
+        text: Optional[str],
+        top_n: int = 25,
+        probe_bands: Optional[int] = None,
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Return up to ``top_n`` ``(key, estimated_jaccard)`` pairs, most similar
+        first.  ``probe_bands`` limits how many bands are consulted (defaults
+        to all of them).
+        """
+        signature = self.signature(text)
+        if signature is None or not self._signatures:
+            return []
+        probe = self.bands if probe_bands is None else max(1, min(int(probe_bands), self.bands))
+
+        candidates: Set[Hashable] = set()
+        for band, band_key in self._band_keys(signature):
+            if band >= probe:
+                break
+            bucket = self._shard(band, band_key).get(band_key)
+            if bucket:
+                candidates.update(bucket)
+
+        if not candidates:
+            return []
+
+        # Score every candidate passage in one comparison, then keep each
+        # key's best passage.
+        keys = list(candidates)
+        stored = [self._signatures[key] for key in keys]
+        offsets = np.cumsum([0] + [len(matrix) for matrix in stored[:-1]])
+        agreeing = np.count_nonzero(np.concatenate(stored) == signature, axis=1)
+        best = np.maximum.reduceat(agreeing, offsets) / self.num_perm
+        order = np.argsort(-best, kind="stable")[:top_n]
+        return [(keys[i], float(best[i])) for i in order]
+
+    def similarity(self, key: Hashable, text: Optional[str]) -> Optional[float]:
+        signature = self.signature(text)
+        if key not in self._signatures or signature is None:
+            return None
+        return float(np.count_nonzero(self._signatures[key] == signature, axis=1).max()) / self.num_perm
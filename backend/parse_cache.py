@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from query_cache import TTLCache
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_parse_text(text: Any) -> str:
+    """Case- and whitespace-insensitive form of a text sent for parsing."""
+    return _WHITESPACE_RE.sub(" ", str(text or "")).strip().casefold()
+
+
+def parse_cache_key(endpoint: str, payload: Dict[str, Any]) -> str:
+    """
+    Content address of a parse call: a hash of the endpoint, the normalized
+    ``text`` and every other payload field (``userId`` for profiles).
+    """
+    fields = {name: value for name, value in payload.items() if name != "text"}
+    encoded = json.dumps(
+        [endpoint, normalize_parse_text(payload.get("text")), fields],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ParseCache:
+    """
+    Two-tier cache of parser service results keyed by :func:`parse_cache_key`.
+
+    The memory tier is a :class:`TTLCache` LRU.  When ``directory`` is given,
+    results are also written there, one JSON file per key stamped with its
+    wall-clock store time, so they survive restarts; a memory miss falls back
+    to the file and promotes a fresh entry.  Both tiers expire entries
+    ``ttl_seconds`` after they were stored.  Values are kept JSON-encoded and
+    decoded on every hit, so callers may mutate what they get back.
+
+    :meth:`get` and :meth:`put` are coroutines for the event loop: the memory
+    tier and the counters are only touched there, and only file I/O runs in
+    a worker thread.
+    """
+
+    # Memory entries never change generation; the TTL alone expires them.
+    _GENERATION = 0
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl_seconds: float = 86400.0,
+        directory: Optional[Path] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.directory = directory
+        self._clock = clock
+        self._memory = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds, clock=clock)
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.disk_errors = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Tuple[Optional[str], bool]:
+        """The stored encoding (None if absent or expired) and whether reading failed."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except FileNotFoundError:
+            return None, False
+        except (OSError, ValueError):
+            return None, True
+        stored_at = entry.get("storedAt", 0)
+        if self._clock() - stored_at >= self.ttl_seconds:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None, False
+        return entry.get("value"), False
+
+    def _write_disk(self, key: str, encoded: str) -> bool:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as out:
+                json.dump({"storedAt": self._clock(), "value": encoded}, out)
+            os.replace(out.name, path)
+        except OSError as exc:
+            print(f"[WARNING] Could not write parse cache entry {path}: {exc}")
+            return False
+        return True
+
+    async def get(self, key: str) -> Optional[Any]:
+        encoded = self._memory.get(key, self._GENERATION)
+        if encoded is not None:
+            self.memory_hits += 1
+            return json.loads(encoded)
+        if self.directory is not None:
+            encoded, failed = await asyncio.to_thread(self._read_disk, key)
+            self.disk_errors += failed
+            if encoded is not None:
+                self.disk_hits += 1
+                self._memory.put(key, encoded, self._GENERATION)
+                return json.loads(encoded)
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, value: Any) -> None:
+        encoded = json.dumps(value, separators=(",", ":"))
+        self._memory.put(key, encoded, self._GENERATION)
+        self.writes += 1
+        if self.directory is not None:
+            if not await asyncio.to_thread(self._write_disk, key, encoded):
+                self.disk_errors += 1
+
+    def stats(self) -> Dict[str, Any]:
+        memory = self._memory.stats()
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "size": memory["size"],
+            "maxSize": memory["maxSize"],
+            "ttlSeconds": self.ttl_seconds,
+            "disk": str(self.directory) if self.directory is not None else None,
+            "memoryHits": self.memory_hits,
+            "diskHits": self.disk_hits,
+            "misses": self.misses,
+            "hitRatio": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+            "writes": self.writes,
+            "expirations": memory["expirations"],
+            "evictions": memory["evictions"],
+            "diskErrors": self.disk_errors,
+        }
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# A standing query's price ceiling when it has none.
+NO_CEILING = float("inf")
+
+
+class RequestPercolator:
+    """
+    Reverse index of standing (open) flash requests.
+
+    Ordinary search takes a query and finds documents; percolation takes a
+    new document (a listing or a seller profile) and finds the standing
+    queries it satisfies.  Each open request is registered under its terms
+    (``category:<name>`` and ``tag:<token>``), and every term keeps its
+    requests sorted by price ceiling.  Percolating a document looks up only
+    the document's own terms and, within each, bisects to the requests whose
+    ceiling admits the document's price, so the cost is proportional to the
+    number of hits rather than to the number of open requests.
+    """
+
+    def __init__(self) -> None:
+        # term -> [(price ceiling, request id)] in ascending order.
+        self._postings: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+        self._queries: Dict[str, Tuple[FrozenSet[str], float]] = {}
+        self._lock = threading.Lock()
+        self.percolated = 0
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def __contains__(self, request_id: object) -> bool:
+        return request_id in self._queries
+
+    def _unregister(self, request_id: str) -> None:
+        previous = self._queries.pop(request_id, None)
+        if previous is None:
+            return
+        terms, ceiling = previous
+        for term in terms:
+            postings = self._postings[term]
+            position = bisect_left(postings, (ceiling, request_id))
+            if position < len(postings) and postings[position] == (ceiling, request_id):
+                del postings[position]
+            if not postings:
+                del self._postings[term]
+
+    def register(self, request_id: str, terms: Iterable[str], price_max: Optional[float] = None) -> bool:
+        """
+        Index (or re-index) ``request_id`` under ``terms``.  A request with
+        no terms cannot be percolated and is not indexed; returns whether it
+        was.
+        """
+        term_set = frozenset(term for term in terms if term)
+        ceiling = NO_CEILING if price_max is None else float(price_max)
+        with self._lock:
+            self._unregister(request_id)
+            if not term_set:
+                return False
+            self._queries[request_id] = (term_set, ceiling)
+            for term in term_set:
+                insort(self._postings[term], (ceiling, request_id))
+            return True
+
+    def unregister(self, request_id: str) -> None:
+        with self._lock:
+            self._unregister(request_id)
+
+    def percolate(self, terms: Iterable[str], price: Optional[float] = None) -> Dict[str, List[str]]:
+        """
+        Standing requests sharing at least one of ``terms`` whose price
+        ceiling is at least ``price`` (any ceiling when ``price`` is None),
+        each mapped to the terms it matched on.
+        """
+        hits: Dict[str, List[str]] = defaultdict(list)
+        floor = (-NO_CEILING, "") if price is None else (float(price), "")
+        with self._lock:
+            for term in set(terms):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                for _, request_id in postings[bisect_left(postings, floor):]:
+                    hits[request_id].append(term)
+            self.percolated += 1
+            self.hits += len(hits)
+        return dict(hits)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "openRequests": len(self._queries),
+            "terms": len(self._postings),
+            "percolated": self.percolated,
+            "hits": self.hits,
+        }
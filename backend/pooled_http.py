@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import importlib.util
+from typing import Any, Dict, Optional
+
+import httpx
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class PooledHTTPClient:
+    """
+    Application-lifetime ``httpx.AsyncClient`` for one upstream service.
+
+    Connections are kept alive in a bounded pool and reused across requests,
+    so only the first call to a host (or one after the keep-alive expiry)
+    pays connection setup.  HTTP/2 is negotiated when the optional ``h2``
+    package is installed.  Every request carries a trace hook that counts
+    new TCP connections and responses served over an already open one, which
+    makes connection reuse visible in :meth:`stats`.  :meth:`start` and
+    :meth:`close` belong in the app's startup and shutdown events; a request
+    before :meth:`start` starts the client lazily.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout_seconds: float = 60.0,
+        connect_timeout_seconds: float = 5.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry_seconds: float = 30.0,
+        http2: Optional[bool] = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2 and HTTP2_AVAILABLE
+        self._timeout = httpx.Timeout(timeout_seconds, connect=connect_timeout_seconds)
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_seconds,
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        self.requests = 0
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.errors = 0
+
+    def start(self) -> None:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self._timeout,
+                limits=self._limits,
+                http2=self.http2,
+            )
+
+    async def close(self) -> None:
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    async def post_json(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        timeout_seconds: Optional[float] = None,
+    ) -> httpx.Response:
+        """
+        POST ``payload`` to ``endpoint`` and raise ``httpx.HTTPStatusError``
+        for error statuses.  ``timeout_seconds`` overrides the client's read
+        timeout for this call only.
+        """
+        self.start()
+        timeout = self._timeout if timeout_seconds is None else httpx.Timeout(
+            timeout_seconds, connect=self._timeout.connect
+        )
+        opened = False
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            nonlocal opened
+            if event_name == "connection.connect_tcp.complete":
+                opened = True
+                self.connections_opened += 1
+
+        self.requests += 1
+        try:
+            response = await self._client.post(endpoint, json=payload, timeout=timeout, extensions={"trace": trace})
+            if not opened:
+                self.connections_reused += 1
+            response.raise_for_status()
+        except httpx.HTTPError:
+            self.errors += 1
+            raise
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "baseUrl": self.base_url,
+            "http2": self.http2,
+            "started": self._client is not None,
+            "maxConnections": self._limits.max_connections,
+            "maxKeepaliveConnections": self._limits.max_keepalive_connections,
+            "requests": self.requests,
+            "connectionsOpened": self.connections_opened,
+            "connectionsReused": self.connections_reused,
+            "reuseRatio": round(self.connections_reused / self.requests, 4) if self.requests else 0.0,
+            "errors": self.errors,
+        }
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import copy
+import tracemalloc
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+
+class SellerRecord:
+    """
+    Immutable, compact view of one seller profile used during matching.
+
+    ``build_match_payload`` needs the same handful of values for every seller
+    on every request (display name, lowercased category, tag tokens, shared
+    traits, dorm, ...).  They are derived once when the profile is ingested
+    and stored in ``__slots__`` attributes, so a record carries no per-instance
+    ``__dict__``.  The original nested profile dict is kept by reference in
+    ``profile`` for the model encoder and the debug payload.
+    """
+
+    __slots__ = (
+        "user_id",
+        "display_name",
+        "major",
+        "dorm",
+        "category",
+        "category_key",
+        "tag_tokens",
+        "keywords",
+        "traits",
+        "place_id",
+        "position",
+        "source",
+        "profile",
+    )
+
+    def __init__(
+        self,
+        *,
+        user_id: str,
+        display_name: str,
+        major: str,
+        dorm: str,
+        category: str,
+        tag_tokens: FrozenSet[str],
+        keywords: FrozenSet[str],
+        traits: Tuple[str, ...],
+        place_id: Optional[int],
+        position: Optional[Tuple[float, float]],
+        source: Optional[str],
+        profile: Dict[str, Any],
+    ) -> None:
+        setter = object.__setattr__
+        setter(self, "user_id", user_id)
+        setter(self, "display_name", display_name)
+        setter(self, "major", major)
+        setter(self, "dorm", dorm)
+        setter(self, "category", category)
+        setter(self, "category_key", category.lower())
+        setter(self, "tag_tokens", tag_tokens)
+        setter(self, "keywords", keywords)
+        setter(self, "traits", traits)
+        setter(self, "place_id", place_id)
+        setter(self, "position", position)
+        setter(self, "source", source)
+        setter(self, "profile", profile)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"SellerRecord(user_id={self.user_id!r}, category={self.category!r})"
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__ if name != "profile"}
+
+
+def memory_report(
+    profiles: List[Dict[str, Any]],
+    build_record: Callable[[Dict[str, Any]], SellerRecord],
+    count: int = 10_000,
+) -> Dict[str, float]:
+    """
+    Per-profile memory of the seller pool before and after ``SellerRecord``,
+    for ``count`` profiles cloned from ``profiles``: the nested profile dict
+    alone (what the pool used to hold) against that same dict plus the record
+    built from it (what the pool holds now, since ``profile`` stays
+    referenced).  Sizes are measured with tracemalloc.
+    """
+    if not profiles:
+        raise ValueError("memory_report needs at least one profile to clone")
+
+    sources = []
+    for index in range(count):
+        clone = copy.deepcopy(profiles[index % len(profiles)])
+        clone["user_id"] = f"{clone['user_id']}_{index}"
+        sources.append(clone)
+
+    def measure(factory: Callable[[Dict[str, Any]], Any]) -> float:
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        built = [factory(source) for source in sources]
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del built
+        return (after - before) / count
+
+    nested_bytes = measure(copy.deepcopy)
+    record_bytes = measure(build_record)
+    retained_bytes = nested_bytes + record_bytes
+    return {
+        "profiles": count,
+        "nestedProfileBytes": round(nested_bytes, 1),
+        "recordBytes": round(record_bytes, 1),
+        "nestedPlusRecordBytes": round(retained_bytes, 1),
+        "overheadPct": round(100.0 * (retained_bytes / nested_bytes - 1), 1) if nested_bytes else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    import json
+
+    import app
+
+    app.load_demo_profiles()
+    demo = list(app.seller_pool.snapshot().profiles.values())
+    print(json.dumps(memory_report(demo, app.build_seller_record), indent=2))
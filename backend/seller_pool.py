@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+from geo_index import SpatialGridIndex
+from lsh_index import MinHashLSHIndex
+from profile_records import SellerRecord
+
+
+# A record to ingest together with the text passages indexed for it.
+PoolEntry = Tuple[SellerRecord, List[str]]
+
+
+class SellerPoolSnapshot:
+    """
+    One published generation of the seller pool.
+
+    A snapshot and everything it references are never mutated after
+    publication, so readers can iterate it without locks while writers
+    prepare the next generation.
+    """
+
+    __slots__ = ("generation", "records", "profiles", "text_index", "locations")
+
+    def __init__(
+        self,
+        generation: int,
+        records: Dict[str, SellerRecord],
+        text_index: MinHashLSHIndex,
+        locations: SpatialGridIndex,
+    ) -> None:
+        self.generation = generation
+        self.records: Mapping[str, SellerRecord] = MappingProxyType(records)
+        self.profiles: Mapping[str, Dict[str, Any]] = MappingProxyType(
+            {user_id: record.profile for user_id, record in records.items()}
+        )
+        self.text_index = text_index
+        self.locations = locations
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, user_id: object) -> bool:
+        return user_id in self.records
+
+
+class SellerPool:
+    """
+    Copy-on-write container for the in-memory seller profiles.
+
+    Writers (demo loading, synthetic seeding, live profile creation) copy the
+    current generation, apply their changes and publish the result with a
+    single reference swap.  Readers call :meth:`snapshot` once and score
+    against that immutable generation, so they never observe a partially
+    applied write or a dict changing size mid-iteration.  Writers serialise
+    on a lock; readers never take it.
+    """
+
+    def __init__(
+        self,
+        text_index_factory: Callable[[], MinHashLSHIndex],
+        location_index_factory: Callable[[], SpatialGridIndex],
+    ) -> None:
+        self._text_index_factory = text_index_factory
+        self._location_index_factory = location_index_factory
+        self._write_lock = threading.Lock()
+        self._current = SellerPoolSnapshot(0, {}, text_index_factory(), location_index_factory())
+
+    @property
+    def generation(self) -> int:
+        return self._current.generation
+
+    def snapshot(self) -> SellerPoolSnapshot:
+        return self._current
+
+    def publish(self, entries: Iterable[PoolEntry], replace: bool = False) -> SellerPoolSnapshot:
+        """
+        Publish a new generation containing ``entries``.  With ``replace`` the
+        new generation holds only ``entries``; otherwise they are upserted
+        into a copy of the current generation.
+
+        Text signatures are computed before the write lock is taken, and the
+        indexes copy only what the entries touch, so a single upsert stays
+        cheap however large the pool is.  Callers on the event loop should
+        still run this in a worker thread.
+        """
+        snapshot, _ = self._publish(entries, replace=replace, only_new=False)
+        return snapshot
+
+    def publish_new(self, entries: Iterable[PoolEntry]) -> List[PoolEntry]:
+        """
+        Publish the ``entries`` whose user is not in the pool yet and return
+        them.  Membership is checked under the write lock, so concurrent
+        callers never both add the same user.
+        """
+        _, published = self._publish(entries, replace=False, only_new=True)
+        return published
+
+    def _publish(
+        self, entries: Iterable[PoolEntry], replace: bool, only_new: bool
+    ) -> Tuple[SellerPoolSnapshot, List[PoolEntry]]:
+        entries = list(entries)
+        fresh_index = self._text_index_factory() if replace else None
+        hasher = fresh_index if fresh_index is not None else self._current.text_index
+        signatures = [hasher.signatures(passages) for _, passages in entries]
+
+        with self._write_lock:
+            base = self._current
+            if only_new:
+                selected = [
+                    index for index, (record, _) in enumerate(entries) if record.user_id not in base.records
+                ]
+                if not selected:
+                    return base, []
+            else:
+                selected = list(range(len(entries)))
+
+            if fresh_index is not None:
+                records: Dict[str, SellerRecord] = {}
+                text_index = fresh_index
+                locations = self._location_index_factory()
+            else:
+                records = dict(base.records)
+                text_index = base.text_index.copy()
+                locations = base.locations.copy()
+
+            for index in selected:
+                record = entries[index][0]
+                records[record.user_id] = record
+                text_index.add_signatures(record.user_id, signatures[index])
+                if record.position:
+                    locations.add(record.user_id, record.position)
+                else:
+                    locations.remove(record.user_id)
+
+            snapshot = SellerPoolSnapshot(base.generation + 1, records, text_index, locations)
+            self._current = snapshot
+            return snapshot, [entries[index] for index in selected]
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from catalog_loader import iter_catalog_sellers
+
+SELLERS = [
+    {
+        "user_id": "ada_1",
+        "bio": 'Sells "vintage" lamps, {desks} and [chairs] \\ escapes é☃',
+        "rating": 4.875,
+        "trades": 1234567890,
+        "listings": [{"price": 12.5e-1, "tags": []}, {"price": -0.0, "tags": ["x"]}],
+    },
+    {"user_id": "bo_2", "bio": "", "rating": 3, "listings": []},
+    {"user_id": "cy_3", "nested": {"deep": [[1, 2], {"k": None, "t": True, "f": False}]}},
+]
+
+# chunk sizes small enough to split every string, escape and number
+CHUNK_SIZES = [1, 2, 3, 5, 7, 64 * 1024]
+
+
+def write_catalog(tmp_path, text):
+    path = tmp_path / "catalog.json"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("chunk_chars", CHUNK_SIZES)
+@pytest.mark.parametrize("indent", [None, 2])
+def test_yields_sellers_across_chunk_boundaries(tmp_path, chunk_chars, indent):
+    document = {
+        "version": 3.14159,
+        "meta": {"sellers": ["not", "these"], "note": "}]{["},
+        "sellers": SELLERS,
+        "count": 1234567,
+    }
+    path = write_catalog(tmp_path, json.dumps(document, indent=indent, ensure_ascii=False))
+
+    assert list(iter_catalog_sellers(path, chunk_chars=chunk_chars)) == SELLERS
+
+
+@pytest.mark.parametrize("chunk_chars", CHUNK_SIZES)
+@pytest.mark.parametrize(
+    "text",
+    ['{"sellers": []}', '{ "sellers" : [ ] , "count": 0 }', "{}", '{"other": [1, 2, 3]}', "  {\n}\n"],
+)
+def test_empty_or_missing_sellers(tmp_path, chunk_chars, text):
+    path = write_catalog(tmp_path, text)
+
+    assert list(iter_catalog_sellers(path, chunk_chars=chunk_chars)) == []
+
+
+def test_custom_key(tmp_path):
+    path = write_catalog(tmp_path, json.dumps({"sellers": [{"a": 1}], "archived": [{"b": 2}]}))
+
+    assert list(iter_catalog_sellers(path, key="archived", chunk_chars=3)) == [{"b": 2}]
+
+
+@pytest.mark.parametrize("chunk_chars", [1, 4, 64 * 1024])
+def test_truncated_file_raises(tmp_path, chunk_chars):
+    text = json.dumps({"sellers": SELLERS, "count": 1234567})
+    # Cut inside the key, a string, a number, between sellers and before the final brace.
+    cuts = [5, text.index("vintage"), text.index("4.875") + 3, text.index('{"user_id": "bo_2"'), len(text) - 1]
+    for cut in cuts:
+        path = write_catalog(tmp_path, text[:cut])
+        with pytest.raises(ValueError):
+            list(iter_catalog_sellers(path, chunk_chars=chunk_chars))
+
+
+@pytest.mark.parametrize("text", ['["sellers"]', '{"sellers": {}}', '{"sellers": [1 2]}', "{1: []}"])
+def test_malformed_catalog_raises(tmp_path, text):
+    path = write_catalog(tmp_path, text)
+
+    with pytest.raises(ValueError):
+        list(iter_catalog_sellers(path, chunk_chars=2))
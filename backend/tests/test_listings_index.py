@@ -0,0 +1,124 @@
+import pytest
+
+from campus_gazetteer import DEFAULT_CAMPUS_PLACES, CampusGazetteer
+from listings_index import SORT_MODES, SORT_RELEVANCE, ListingsIndex, decode_listings_cursor
+
+PRICES = [10, 24.99, 25, 50, 139]
+DATES = ["2025-09-17", "2025-09-17", "2025-10-01", "", "2025-08-30"]
+RATINGS = [0, 4.5, 4.5, 4.99]
+TITLES = ["desk lamp", "calculus textbook", "mini fridge", "desk chair", "road bike"]
+
+
+def make_sellers():
+    # Few distinct prices, dates and ratings, so every sort mode has many ties.
+    sellers = []
+    for seller_index in range(8):
+        sellers.append({
+            "user_id": f"seller_{seller_index}",
+            "full_name": f"Seller {seller_index}",
+            "seller_rating_avg": RATINGS[seller_index % len(RATINGS)],
+            "inferred_location_keywords": ["library"],
+            "current_item_listings": [
+                {
+                    "parsed_item": f"{TITLES[(seller_index + item) % len(TITLES)]} {seller_index}-{item}",
+                    "category": "furniture" if item % 2 else "electronics",
+                    "condition": "good",
+                    "price": PRICES[(seller_index * 3 + item) % len(PRICES)],
+                    "date_posted": DATES[(seller_index + item * 2) % len(DATES)],
+                    "description": "Works great, pick up near the library.",
+                }
+                for item in range(5)
+            ],
+        })
+    return sellers
+
+
+@pytest.fixture(scope="module")
+def index():
+    gazetteer = CampusGazetteer(DEFAULT_CAMPUS_PLACES, center=(34.0689, -118.4452))
+    return ListingsIndex(make_sellers(), gazetteer)
+
+
+def walk(index, limit, **filters):
+    ids, cursor = [], None
+    while True:
+        page = index.query(limit=limit, cursor=cursor, **filters)
+        ids.extend(listing["id"] for listing in page.listings)
+        cursor = page.next_cursor
+        if cursor is None:
+            return ids, page.total
+
+
+@pytest.mark.parametrize("mode", SORT_MODES)
+@pytest.mark.parametrize("limit", [1, 3, 7, 100])
+def test_pages_cover_every_listing_once(index, mode, limit):
+    filters = {"sort": mode, "search": "desk" if mode == SORT_RELEVANCE else None}
+    expected = [listing["id"] for listing in index.query(**filters).listings]
+
+    ids, total = walk(index, limit, **filters)
+
+    assert ids == expected
+    assert len(set(ids)) == len(ids) == total
+    if mode != SORT_RELEVANCE:
+        assert total == len(index.listings) == 40
+
+
+@pytest.mark.parametrize("limit", [1, 4])
+def test_pages_under_filters(index, limit):
+    filters = {"sort": "price_desc", "category": "Furniture", "price_min": 20, "price_max": 100}
+    expected = [listing["id"] for listing in index.query(**filters).listings]
+
+    ids, total = walk(index, limit, **filters)
+
+    assert ids == expected and total == len(expected) > 0
+
+
+def test_price_sorts_are_ordered(index):
+    price_of = {listing["id"]: float(index._price[position]) for position, listing in enumerate(index.listings)}
+    ascending = [price_of[listing["id"]] for listing in index.query(sort="price_asc").listings]
+    descending = [price_of[listing["id"]] for listing in index.query(sort="price_desc").listings]
+
+    assert ascending == sorted(ascending)
+    assert descending == sorted(descending, reverse=True)
+
+
+def test_cursor_from_another_sort_is_rejected(index):
+    cursor = index.query(sort="price_asc", limit=2).next_cursor
+    assert decode_listings_cursor(cursor)["o"] == "price_asc"
+
+    with pytest.raises(ValueError):
+        index.query(sort="trust", limit=2, cursor=cursor)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30"])
+def test_malformed_cursor_is_rejected(index, cursor):
+    with pytest.raises(ValueError):
+        index.query(limit=2, cursor=cursor)
+
+
+def test_unknown_sort_is_rejected(index):
+    with pytest.raises(ValueError):
+        index.query(sort="cheapest")
+
+
+def test_price_range_uses_real_prices(index):
+    assert index.query(price_min=24.99, price_max=24.99).total == 8
+    assert index.query(price_max=24).total == 8
+    assert index.query(price_min=25, price_max=50).total == 16
+
+
+@pytest.mark.parametrize("price_min, price_max", [(60, 40), (500, None), (None, 5), (11, 24)])
+def test_empty_or_inverted_price_range(index, price_min, price_max):
+    page = index.query(price_min=price_min, price_max=price_max, limit=5)
+
+    assert page.listings == [] and page.total == 0 and page.next_cursor is None
+    # The price facet ignores its own filter, so other buckets still report counts.
+    assert sum(page.facets["priceBucket"].values()) == 40
+
+
+def test_facets_count_under_the_other_filters(index):
+    page = index.query(category="Furniture", limit=1)
+
+    assert page.total == 16
+    assert sum(page.facets["category"].values()) == 40
+    assert sum(page.facets["priceBucket"].values()) == 16
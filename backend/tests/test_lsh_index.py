@@ -0,0 +1,60 @@
+from lsh_index import MinHashLSHIndex
+
+
+def keys(hits):
+    return [key for key, _ in hits]
+
+
+def test_add_query_and_remove():
+    index = MinHashLSHIndex()
+    index.add("lamp", ["vintage brass desk lamp", "warm reading light"])
+    index.add("bike", ["road bike with lock and helmet"])
+
+    hits = index.query("vintage brass desk lamp")
+    assert keys(hits)[0] == "lamp"
+    assert hits[0][1] == 1.0
+
+    index.remove("lamp")
+    assert "lamp" not in index
+    assert "lamp" not in keys(index.query("vintage brass desk lamp"))
+    index.remove("lamp")  # removing a missing key is a no-op
+
+
+def test_re_adding_a_key_replaces_its_passages():
+    index = MinHashLSHIndex()
+    index.add("seller", ["calculus textbook bundle"])
+    index.add("seller", ["mini fridge for dorm rooms"])
+
+    assert len(index) == 1
+    assert keys(index.query("mini fridge for dorm rooms")) == ["seller"]
+    assert index.query("calculus textbook bundle") == []
+
+    index.remove("seller")
+    assert len(index) == 0
+    assert index.query("mini fridge for dorm rooms") == []
+
+
+def test_re_adding_without_passages_removes_the_key():
+    index = MinHashLSHIndex()
+    index.add("seller", ["usb-c charger"])
+
+    assert index.add("seller", ["", None]) is False
+    assert "seller" not in index
+    assert index.query("usb-c charger") == []
+
+
+def test_copy_is_independent_of_its_source():
+    source = MinHashLSHIndex()
+    source.add("a", ["red bike lock"])
+    source.add("b", ["blue bike lock"])
+
+    clone = source.copy()
+    clone.add("a", ["graphing calculator"])
+    clone.remove("b")
+    source.add("c", ["red bike lock"])
+
+    assert sorted(keys(source.query("red bike lock"))[:2]) == ["a", "c"]
+    assert "b" in keys(source.query("blue bike lock"))
+    assert keys(clone.query("red bike lock")) == []
+    assert keys(clone.query("graphing calculator")) == ["a"]
+    assert clone.similarity("a", "graphing calculator") == 1.0
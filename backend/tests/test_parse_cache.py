@@ -0,0 +1,65 @@
+import asyncio
+
+from parse_cache import ParseCache, parse_cache_key
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_key_ignores_case_and_whitespace_but_not_other_fields():
+    key = parse_cache_key("/api/parse-profile", {"text": "Need a  Charger", "userId": "a"})
+
+    assert key == parse_cache_key("/api/parse-profile", {"text": " need a charger ", "userId": "a"})
+    assert key != parse_cache_key("/api/parse-profile", {"text": "need a charger", "userId": "b"})
+    assert key != parse_cache_key("/api/parse", {"text": "need a charger", "userId": "a"})
+
+
+def test_memory_tier_round_trip_and_expiry():
+    async def scenario():
+        clock = Clock()
+        cache = ParseCache(maxsize=4, ttl_seconds=60, clock=clock)
+        assert await cache.get("k") is None
+        await cache.put("k", {"context": {"original_text": "x"}})
+        hit = await cache.get("k")
+        hit["context"]["original_text"] = "changed"
+        assert (await cache.get("k"))["context"]["original_text"] == "x"
+        clock.now += 60
+        assert await cache.get("k") is None
+        return cache.stats()
+
+    stats = asyncio.run(scenario())
+    assert (stats["memoryHits"], stats["misses"], stats["writes"]) == (2, 2, 1)
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    async def scenario():
+        clock = Clock()
+        await ParseCache(ttl_seconds=60, directory=tmp_path, clock=clock).put("k", [1, 2])
+        restarted = ParseCache(ttl_seconds=60, directory=tmp_path, clock=clock)
+        first, second = await restarted.get("k"), await restarted.get("k")
+        clock.now += 60
+        expired = await ParseCache(ttl_seconds=60, directory=tmp_path, clock=clock).get("k")
+        return first, second, expired, restarted.stats()
+
+    first, second, expired, stats = asyncio.run(scenario())
+    assert first == second == [1, 2]
+    assert expired is None
+    assert (stats["diskHits"], stats["memoryHits"], stats["diskErrors"]) == (1, 1, 0)
+
+
+def test_unreadable_disk_entry_counts_as_error(tmp_path):
+    async def scenario():
+        cache = ParseCache(directory=tmp_path)
+        path = cache._path("abcd")
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json", encoding="utf-8")
+        return await cache.get("abcd"), cache.stats()
+
+    value, stats = asyncio.run(scenario())
+    assert value is None
+    assert (stats["diskErrors"], stats["misses"]) == (1, 1)
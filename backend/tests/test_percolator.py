@@ -0,0 +1,57 @@
+from percolator import RequestPercolator
+
+
+def make_percolator():
+    percolator = RequestPercolator()
+    percolator.register("charger", ["category:electronics", "tag:charger", "tag:usb"], price_max=40)
+    percolator.register("lamp", ["category:furniture", "tag:lamp"])
+    return percolator
+
+
+def test_matching_document_hits_its_requests():
+    percolator = make_percolator()
+
+    hits = percolator.percolate(["category:electronics", "tag:charger", "tag:cable"], price=25)
+
+    assert set(hits) == {"charger"}
+    assert sorted(hits["charger"]) == ["category:electronics", "tag:charger"]
+    assert percolator.percolate(["tag:lamp"], price=500) == {"lamp": ["tag:lamp"]}
+    assert percolator.stats()["hits"] == 2
+
+
+def test_price_ceiling_is_inclusive():
+    percolator = make_percolator()
+
+    assert "charger" in percolator.percolate(["tag:charger"], price=40)
+    assert "charger" in percolator.percolate(["tag:charger"], price=None)
+    assert percolator.percolate(["tag:charger"], price=40.01) == {}
+
+
+def test_non_matching_document_hits_nothing():
+    percolator = make_percolator()
+
+    assert percolator.percolate(["category:clothing", "tag:hoodie"], price=10) == {}
+    assert percolator.percolate([], price=10) == {}
+    assert percolator.stats()["hits"] == 0
+
+
+def test_unregister_and_reregister():
+    percolator = make_percolator()
+
+    percolator.unregister("charger")
+    percolator.unregister("charger")  # unknown ids are ignored
+    assert "charger" not in percolator
+    assert percolator.percolate(["category:electronics", "tag:charger"], price=5) == {}
+
+    # Re-registering replaces the previous terms and ceiling.
+    percolator.register("lamp", ["tag:desk"], price_max=15)
+    assert percolator.percolate(["tag:lamp"]) == {}
+    assert percolator.percolate(["tag:desk"], price=15) == {"lamp": ["tag:desk"]}
+    assert percolator.stats()["terms"] == 1
+
+
+def test_request_without_terms_is_not_indexed():
+    percolator = RequestPercolator()
+
+    assert percolator.register("vague", ["", None]) is False
+    assert len(percolator) == 0
@@ -0,0 +1,82 @@
+import threading
+
+from geo_index import SpatialGridIndex
+from lsh_index import MinHashLSHIndex
+from profile_records import SellerRecord
+from seller_pool import SellerPool
+
+
+def make_pool():
+    return SellerPool(MinHashLSHIndex, SpatialGridIndex)
+
+
+def entry(user_id, text, position=(34.0689, -118.4452)):
+    record = SellerRecord(
+        user_id=user_id,
+        display_name=user_id,
+        major="Undeclared",
+        dorm="On campus",
+        category="Electronics",
+        tag_tokens=frozenset(),
+        keywords=frozenset(),
+        traits=(),
+        place_id=None,
+        position=position,
+        source="test",
+        profile={"user_id": user_id, "raw_text": text},
+    )
+    return record, [text]
+
+
+def test_republishing_a_user_replaces_it():
+    pool = make_pool()
+    pool.publish([entry("ada", "calculus textbook bundle"), entry("bo", "road bike lock")])
+    snapshot = pool.publish([entry("ada", "mini fridge for dorm rooms", position=None)])
+
+    assert snapshot.generation == 2
+    assert len(snapshot) == 2
+    assert snapshot.records["ada"].profile["raw_text"] == "mini fridge for dorm rooms"
+    assert [key for key, _ in snapshot.text_index.query("mini fridge for dorm rooms")] == ["ada"]
+    assert snapshot.text_index.query("calculus textbook bundle") == []
+    assert "ada" not in snapshot.locations
+    assert "bo" in snapshot.locations
+
+
+def test_earlier_snapshots_are_unchanged_by_later_publishes():
+    pool = make_pool()
+    first = pool.publish([entry("ada", "calculus textbook bundle")])
+    pool.publish([entry("ada", "mini fridge for dorm rooms"), entry("bo", "road bike lock")])
+
+    assert len(first) == 1
+    assert [key for key, _ in first.text_index.query("calculus textbook bundle")] == ["ada"]
+    assert first.text_index.query("road bike lock") == []
+
+
+def test_publish_new_skips_users_already_in_the_pool():
+    pool = make_pool()
+    pool.publish([entry("ada", "calculus textbook bundle")])
+
+    published = pool.publish_new([entry("ada", "mini fridge"), entry("bo", "road bike lock")])
+
+    assert [record.user_id for record, _ in published] == ["bo"]
+    assert pool.snapshot().records["ada"].profile["raw_text"] == "calculus textbook bundle"
+    assert pool.publish_new([entry("bo", "road bike lock")]) == []
+    assert pool.generation == 2
+
+
+def test_concurrent_publish_new_adds_each_user_once():
+    pool = make_pool()
+    batch = [entry(f"seller_{index}", f"listing number {index}") for index in range(50)]
+    results = []
+
+    def seed():
+        results.append(pool.publish_new(batch))
+
+    threads = [threading.Thread(target=seed) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(len(published) for published in results) == [0, 0, 0, 50]
+    assert len(pool.snapshot()) == 50
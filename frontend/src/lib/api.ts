@@ -123,11 +123,43 @@ const mockFlags: Flag[] = [
   { id: '5', reason: 'Harassment', snippet: 'User reported for harassment', userId: '6', severity: 'critical', createdAt: '2024-01-12T09:45:00Z', status: 'pending' },
 ]
 
-type ListingsFilters = {
+export type ListingsFilters = {
   search?: string
   category?: string
+  condition?: string
+  priceMin?: number
   priceMax?: number
   verifiedOnly?: boolean
+  sort?: 'newest' | 'price_asc' | 'price_desc' | 'trust' | 'rating' | 'relevance'
+  limit?: number
+  cursor?: string
+}
+
+export type StandingAlert = {
+  kind: 'seller' | 'listing'
+  id: string
+  name?: string
+  title?: string
+  price?: string
+  sellerId?: string
+  likelihood?: number
+  matchedOn: string[]
+  createdAt: string
+}
+
+export type ListingSuggestion = {
+  text: string
+  type: 'title' | 'category' | 'major' | 'location'
+  count: number
+}
+
+type ListingFacets = Record<'category' | 'priceBucket' | 'condition' | 'verified', Record<string, number>>
+
+type ListingsPage = {
+  listings: Listing[]
+  total: number
+  nextCursor: string | null
+  facets?: ListingFacets
 }
 
 // Mock API functions
@@ -190,43 +222,85 @@ export const api = {
     return data
   },
 
-  searchListings: async (filters: ListingsFilters = {}): Promise<{ listings: Listing[] }> => {
-    const { search = '', category, priceMax, verifiedOnly } = filters
+  getStandingAlerts: async (requestId: string): Promise<{ status: 'open' | 'closed'; alerts: StandingAlert[] }> => {
+    const response = await request<{ success: boolean; status: 'open' | 'closed'; alerts: StandingAlert[] }>(
+      `/api/flash-requests/${requestId}/alerts`,
+    )
+    return { status: response.status, alerts: response.alerts || [] }
+  },
+
+  closeFlashRequest: async (requestId: string): Promise<{ success: boolean; status: string }> => {
+    return request<{ success: boolean; status: string }>(`/api/flash-requests/${requestId}/close`, {
+      method: 'POST',
+    })
+  },
+
+  searchListings: async (filters: ListingsFilters = {}): Promise<ListingsPage> => {
+    const { search = '', category, condition, priceMin, priceMax, verifiedOnly, sort, limit, cursor } = filters
 
     try {
       const params = new URLSearchParams()
       if (search) params.append('search', search)
       if (category && category !== 'All') params.append('category', category)
+      if (condition) params.append('condition', condition)
+      if (priceMin !== undefined) params.append('priceMin', priceMin.toString())
       if (priceMax !== undefined) params.append('priceMax', priceMax.toString())
       if (verifiedOnly) params.append('verifiedOnly', 'true')
+      if (sort) params.append('sort', sort)
+      if (limit !== undefined) params.append('limit', limit.toString())
+      if (cursor) params.append('cursor', cursor)
 
       const response = await request<{
         success: boolean
         listings: Listing[]
         total: number
+        nextCursor: string | null
+        facets?: ListingFacets
       }>(`/api/listings?${params.toString()}`)
 
       return {
         listings: response.listings || [],
+        total: response.total ?? (response.listings || []).length,
+        nextCursor: response.nextCursor ?? null,
+        facets: response.facets,
       }
     } catch (error) {
       console.error('Error fetching listings from backend, falling back to mock data:', error)
       // Fallback to mock data if backend is unavailable
+      const listings = mockListings.filter((listing) => {
+        if (category && category !== 'All' && listing.category !== category) return false
+        if (verifiedOnly && !listing.owner.verified) return false
+        if (condition && listing.condition?.toLowerCase() !== condition.toLowerCase()) return false
+        if (search && !listing.title.toLowerCase().includes(search.toLowerCase())) return false
+        if (priceMin !== undefined || priceMax !== undefined) {
+          const numericPrice = Number(listing.price.replace(/[^0-9.]/g, ''))
+          if (!Number.isNaN(numericPrice) && priceMin !== undefined && numericPrice < priceMin) return false
+          if (!Number.isNaN(numericPrice) && priceMax !== undefined && numericPrice > priceMax) return false
+        }
+        return true
+      })
       return {
-        listings: mockListings.filter((listing) => {
-          if (category && category !== 'All' && listing.category !== category) return false
-          if (verifiedOnly && !listing.owner.verified) return false
-          if (search && !listing.title.toLowerCase().includes(search.toLowerCase())) return false
-          if (priceMax !== undefined) {
-            const numericPrice = Number(listing.price.replace(/[^0-9.]/g, ''))
-            if (!Number.isNaN(numericPrice) && numericPrice > priceMax) return false
-          }
-          return true
-        }),
+        listings,
+        total: listings.length,
+        nextCursor: null,
       }
     }
   },
 
+  autocompleteListings: async (query: string, limit = 8): Promise<ListingSuggestion[]> => {
+    if (!query.trim()) return []
+    try {
+      const params = new URLSearchParams({ q: query, limit: limit.toString() })
+      const response = await request<{ success: boolean; suggestions: ListingSuggestion[] }>(
+        `/api/listings/autocomplete?${params.toString()}`,
+      )
+      return response.suggestions || []
+    } catch (error) {
+      console.error('Error fetching listing suggestions:', error)
+      return []
+    }
+  },
+
   getMessages: async (): Promise<{ success: boolean; threads: any[] }> => {
     await new Promise((resolve) => setTimeout(resolve, 500))
     
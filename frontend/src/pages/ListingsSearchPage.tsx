@@ -5,7 +5,7 @@ import { Input } from '@/components/ui/input'
 import { Button } from '@/components/ui/button'
 import { Select, SelectTrigger, SelectContent, SelectItem } from '@/components/ui/select'
 import { Checkbox } from '@/components/ui/checkbox'
-import { api, Listing } from '@/lib/api'
+import { api, Listing, ListingsFilters, ListingSuggestion } from '@/lib/api'
 import { toast } from 'sonner'
 import { useNavigate } from 'react-router-dom'
 
@@ -17,7 +17,15 @@ export function ListingsSearchPage() {
   const [priceMax, setPriceMax] = useState<string>('')
   const [verifiedOnly, setVerifiedOnly] = useState(false)
   const [listings, setListings] = useState<Listing[]>([])
+  const [total, setTotal] = useState(0)
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  // Filters of the fetch that produced nextCursor; edits made since are not applied until the next search.
+  const [cursorFilters, setCursorFilters] = useState<ListingsFilters>({})
+  // Index of the first listing of the latest page, so only that page's entry animation is staggered.
+  const [pageStart, setPageStart] = useState(0)
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [suggestions, setSuggestions] = useState<ListingSuggestion[]>([])
 
   const categories = ['All', 'Textbooks', 'Electronics', 'Clothing', 'Food', 'Furniture', 'Other']
   const distances = ['All', '0.5 mi', '1 mi', '2 mi', '5 mi']
@@ -27,19 +35,38 @@ export function ListingsSearchPage() {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [category, distance, priceMax, verifiedOnly])
 
+  useEffect(() => {
+    let cancelled = false
+    const timer = setTimeout(async () => {
+      const next = await api.autocompleteListings(searchQuery)
+      if (!cancelled) setSuggestions(next)
+    }, 120)
+    return () => {
+      cancelled = true
+      clearTimeout(timer)
+    }
+  }, [searchQuery])
+
+  const currentFilters = (): ListingsFilters => ({
+    search: searchQuery,
+    category: category !== 'All' ? category : undefined,
+    priceMax: priceMax ? Number(priceMax) : undefined,
+    verifiedOnly,
+  })
+
   const fetchListings = async () => {
     try {
       setLoading(true)
-      const result = await api.searchListings({
-        search: searchQuery,
-        category: category !== 'All' ? category : undefined,
-        priceMax: priceMax ? Number(priceMax) : undefined,
-        verifiedOnly,
-      })
+      const filters = currentFilters()
+      const result = await api.searchListings(filters)
       setListings(result.listings)
+      setPageStart(0)
+      setTotal(result.total)
+      setNextCursor(result.nextCursor)
+      setCursorFilters(filters)
       if (searchQuery) {
         toast.success('Search completed', {
-          description: `Found ${result.listings.length} listing${result.listings.length !== 1 ? 's' : ''}`,
+          description: `Found ${result.total} listing${result.total !== 1 ? 's' : ''}`,
         })
       }
     } catch (error) {
@@ -52,6 +79,25 @@ export function ListingsSearchPage() {
     }
   }
 
+  const loadMore = async () => {
+    if (!nextCursor) return
+    try {
+      setLoadingMore(true)
+      const result = await api.searchListings({ ...cursorFilters, cursor: nextCursor })
+      setPageStart(listings.length)
+      setListings((previous) => [...previous, ...result.listings])
+      setTotal(result.total)
+      setNextCursor(result.nextCursor)
+    } catch (error) {
+      toast.error('Failed to load more listings', {
+        description: 'Please try again',
+      })
+      console.error(error)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   const handleSearch = async (e: React.FormEvent) => {
     e.preventDefault()
     await fetchListings()
@@ -98,7 +144,14 @@ export function ListingsSearchPage() {
             value={searchQuery}
             onChange={(e) => setSearchQuery(e.target.value)}
             className="pl-10 h-12 text-base"
+            list="listing-suggestions"
+            autoComplete="off"
           />
+          <datalist id="listing-suggestions">
+            {suggestions.map((suggestion) => (
+              <option key={`${suggestion.type}-${suggestion.text}`} value={suggestion.text} />
+            ))}
+          </datalist>
         </div>
       </form>
 
@@ -186,112 +239,124 @@ export function ListingsSearchPage() {
               <p className="text-sm mt-2">Try adjusting your filters</p>
             </div>
           ) : (
-            <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
-              {listings.map((listing, index) => (
-                <motion.div
-                  key={listing.id}
-                  initial={{ opacity: 0, y: 20 }}
-                  animate={{ opacity: 1, y: 0 }}
-                  transition={{ duration: 0.3, delay: index * 0.05 }}
-                  className="rounded-2xl border border-border bg-card overflow-hidden shadow-md hover:shadow-lg transition-shadow"
-                >
-                  {/* Image */}
-                  <div className="h-48 bg-muted flex items-center justify-center text-6xl">
-                    {listing.photo}
-                  </div>
+            <>
+              <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
+                {listings.map((listing, index) => (
+                  <motion.div
+                    key={listing.id}
+                    initial={{ opacity: 0, y: 20 }}
+                    animate={{ opacity: 1, y: 0 }}
+                    transition={{ duration: 0.3, delay: Math.max(index - pageStart, 0) * 0.05 }}
+                    className="rounded-2xl border border-border bg-card overflow-hidden shadow-md hover:shadow-lg transition-shadow"
+                  >
+                    {/* Image */}
+                    <div className="h-48 bg-muted flex items-center justify-center text-6xl">
+                      {listing.photo}
+                    </div>
 
-                  {/* Content */}
-                  <div className="p-4 space-y-3">
-                    <div>
-                      <h3 className="font-semibold text-lg mb-1">{listing.title}</h3>
-                      <div className="flex items-center gap-2 text-sm text-muted-foreground mb-2">
-                        <MapPin className="h-3 w-3" />
-                        <span>{listing.location || listing.owner.dorm}</span>
-                        {listing.owner.verified && (
-                          <>
-                            <span>•</span>
-                            <span className="flex items-center gap-1 text-primary">
-                              <Shield className="h-3 w-3" />
-                              Verified
-                            </span>
-                          </>
-                        )}
-                      </div>
-                      
-                      {/* Condition and Category */}
-                      {listing.condition && (
-                        <div className="text-xs text-muted-foreground mb-1">
-                          Condition: <span className="capitalize">{listing.condition}</span>
+                    {/* Content */}
+                    <div className="p-4 space-y-3">
+                      <div>
+                        <h3 className="font-semibold text-lg mb-1">{listing.title}</h3>
+                        <div className="flex items-center gap-2 text-sm text-muted-foreground mb-2">
+                          <MapPin className="h-3 w-3" />
+                          <span>{listing.location || listing.owner.dorm}</span>
+                          {listing.owner.verified && (
+                            <>
+                              <span>•</span>
+                              <span className="flex items-center gap-1 text-primary">
+                                <Shield className="h-3 w-3" />
+                                Verified
+                              </span>
+                            </>
+                          )}
                         </div>
-                      )}
                       
-                      {/* Description */}
-                      {listing.description && (
-                        <p className="text-sm text-muted-foreground line-clamp-2 mb-2">
-                          {listing.description}
-                        </p>
-                      )}
+                        {/* Condition and Category */}
+                        {listing.condition && (
+                          <div className="text-xs text-muted-foreground mb-1">
+                            Condition: <span className="capitalize">{listing.condition}</span>
+                          </div>
+                        )}
+                      
+                        {/* Description */}
+                        {listing.description && (
+                          <p className="text-sm text-muted-foreground line-clamp-2 mb-2">
+                            {listing.description}
+                          </p>
+                        )}
                       
-                      {/* Badges */}
-                      {listing.owner.badges && listing.owner.badges.length > 0 && (
-                        <div className="flex flex-wrap gap-1 mb-2">
-                          {listing.owner.badges.map((badge, idx) => (
-                            <span
-                              key={idx}
-                              className="px-2 py-0.5 text-xs bg-primary/10 text-primary rounded-full"
-                            >
-                              {badge}
-                            </span>
-                          ))}
-                        </div>
-                      )}
-                    </div>
+                        {/* Badges */}
+                        {listing.owner.badges && listing.owner.badges.length > 0 && (
+                          <div className="flex flex-wrap gap-1 mb-2">
+                            {listing.owner.badges.map((badge, idx) => (
+                              <span
+                                key={idx}
+                                className="px-2 py-0.5 text-xs bg-primary/10 text-primary rounded-full"
+                              >
+                                {badge}
+                              </span>
+                            ))}
+                          </div>
+                        )}
+                      </div>
 
-                    <div className="flex items-center justify-between">
-                      <div>
-                        <div className="text-2xl font-bold text-primary">{listing.price}</div>
-                        <div className="text-xs text-muted-foreground">
-                          Trust Score: {listing.owner.trustScore}% • {listing.owner.rating}⭐
-                        </div>
-                        <div className="text-xs text-muted-foreground">
-                          {listing.owner.pastTrades} past trades
+                      <div className="flex items-center justify-between">
+                        <div>
+                          <div className="text-2xl font-bold text-primary">{listing.price}</div>
+                          <div className="text-xs text-muted-foreground">
+                            Trust Score: {listing.owner.trustScore}% • {listing.owner.rating}⭐
+                          </div>
+                          <div className="text-xs text-muted-foreground">
+                            {listing.owner.pastTrades} past trades
+                          </div>
                         </div>
                       </div>
-                    </div>
 
-                    {/* Quick Actions */}
-                    <div className="flex gap-2 pt-2 border-t border-border">
-                      <Button
-                        variant="outline"
-                        size="sm"
-                        onClick={() => handleMessage(listing.id)}
-                        className="flex-1 gap-1"
-                      >
-                        <MessageSquare className="h-4 w-4" />
-                        Message
-                      </Button>
-                      <Button
-                        variant="outline"
-                        size="sm"
-                        onClick={() => handleRequest(listing)}
-                        className="flex-1 gap-1"
-                      >
-                        <Send className="h-4 w-4" />
-                        Request
-                      </Button>
-                      <Button
-                        variant="ghost"
-                        size="sm"
-                        onClick={() => handleReport(listing.id)}
-                        className="gap-1"
-                      >
-                        <Flag className="h-4 w-4" />
-                      </Button>
+                      {/* Quick Actions */}
+                      <div className="flex gap-2 pt-2 border-t border-border">
+                        <Button
+                          variant="outline"
+                          size="sm"
+                          onClick={() => handleMessage(listing.id)}
+                          className="flex-1 gap-1"
+                        >
+                          <MessageSquare className="h-4 w-4" />
+                          Message
+                        </Button>
+                        <Button
+                          variant="outline"
+                          size="sm"
+                          onClick={() => handleRequest(listing)}
+                          className="flex-1 gap-1"
+                        >
+                          <Send className="h-4 w-4" />
+                          Request
+                        </Button>
+                        <Button
+                          variant="ghost"
+                          size="sm"
+                          onClick={() => handleReport(listing.id)}
+                          className="gap-1"
+                        >
+                          <Flag className="h-4 w-4" />
+                        </Button>
+                      </div>
                     </div>
-                  </div>
-                </motion.div>
-              ))}
-            </div>
+                  </motion.div>
+                ))}
+              </div>
+              {nextCursor && (
+                <div className="flex flex-col items-center gap-2 py-6">
+                  <p className="text-sm text-muted-foreground">
+                    Showing {listings.length} of {total} listings
+                  </p>
+                  <Button variant="outline" onClick={loadMore} disabled={loadingMore}>
+                    {loadingMore ? 'Loading...' : 'Load more'}
+                  </Button>
+                </div>
+              )}
+            </>
           )}
         </div>
       </div>
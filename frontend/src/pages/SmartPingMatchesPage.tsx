@@ -4,7 +4,7 @@ import { useSearchParams, useNavigate } from 'react-router-dom'
 import { motion } from 'framer-motion'
 import { Button } from '@/components/ui/button'
 import { Checkbox } from '@/components/ui/checkbox'
-import { api } from '@/lib/api'
+import { api, StandingAlert } from '@/lib/api'
 import { toast } from 'sonner'
 import {
   MapPin,
@@ -214,6 +214,9 @@ export function SmartPingMatchesPage() {
   const [showPipelineDialog, setShowPipelineDialog] = useState(false)
   const [openSellerProfileId, setOpenSellerProfileId] = useState<string | null>(null)
   const [debugPopups, setDebugPopups] = useState<DebugPopupDescriptor[]>([])
+  const [standingAlerts, setStandingAlerts] = useState<StandingAlert[]>([])
+  const [requestStatus, setRequestStatus] = useState<'open' | 'closed'>('open')
+  const [closingRequest, setClosingRequest] = useState(false)
   const lastPopupRequestRef = useRef<string | null>(null)
 
   const resolveUrgencyLabel = (value?: string | null) => {
@@ -527,6 +530,48 @@ export function SmartPingMatchesPage() {
     }
   }
 
+  useEffect(() => {
+    // New sellers and listings that fit this request arrive as standing
+    // alerts while it stays open.
+    let cancelled = false
+    let timer: ReturnType<typeof setTimeout> | undefined
+    const poll = async () => {
+      try {
+        const { status, alerts } = await api.getStandingAlerts(requestId)
+        if (cancelled) return
+        setStandingAlerts(alerts)
+        setRequestStatus(status)
+        if (status === 'open') {
+          timer = setTimeout(poll, 15000)
+        }
+      } catch {
+        // Alerts are best effort; the matches list works without them.
+      }
+    }
+    poll()
+    return () => {
+      cancelled = true
+      if (timer) clearTimeout(timer)
+    }
+  }, [requestId])
+
+  const handleCloseRequest = async () => {
+    try {
+      setClosingRequest(true)
+      await api.closeFlashRequest(requestId)
+      setRequestStatus('closed')
+      toast.success('Request closed', {
+        description: 'You will not get new alerts for this request',
+      })
+    } catch (error) {
+      toast.error('Failed to close request', {
+        description: 'Please try again',
+      })
+    } finally {
+      setClosingRequest(false)
+    }
+  }
+
   const handleBroadcast = async (type: 'narrow' | 'wide') => {
     try {
       await api.pingMatches(requestId, [], type)
@@ -719,6 +764,49 @@ export function SmartPingMatchesPage() {
                 <span className="text-2xl font-bold text-primary">{matches.length}</span>
               </div>
             </div>
+
+            <div className="mt-6 pt-6 border-t border-border space-y-3">
+              <div className="flex items-center justify-between">
+                <span className="text-sm font-medium">New Alerts</span>
+                <span className="text-xs text-muted-foreground capitalize">{requestStatus}</span>
+              </div>
+              {standingAlerts.length === 0 ? (
+                <p className="text-xs text-muted-foreground">
+                  {requestStatus === 'open'
+                    ? 'New sellers and listings that fit this request will show up here.'
+                    : 'This request is closed.'}
+                </p>
+              ) : (
+                <ul className="space-y-2">
+                  {standingAlerts.map((alert) => (
+                    <li
+                      key={`${alert.kind}-${alert.id}`}
+                      className="flex items-center justify-between gap-2 rounded-lg bg-muted/50 px-3 py-2 text-sm"
+                    >
+                      <span className="flex items-center gap-2 truncate">
+                        <Bell className="h-3 w-3 shrink-0 text-primary" />
+                        <span className="truncate">{alert.kind === 'listing' ? alert.title : alert.name}</span>
+                      </span>
+                      <span className="shrink-0 text-xs text-muted-foreground">
+                        {alert.kind === 'listing' ? alert.price : `${alert.likelihood?.toFixed(1) ?? '—'}%`}
+                      </span>
+                    </li>
+                  ))}
+                </ul>
+              )}
+              {requestStatus === 'open' && (
+                <Button
+                  variant="outline"
+                  size="sm"
+                  onClick={handleCloseRequest}
+                  disabled={closingRequest}
+                  className="w-full gap-2"
+                >
+                  <X className="h-4 w-4" />
+                  {closingRequest ? 'Closing...' : 'Close Request'}
+                </Button>
+              )}
+            </div>
           </motion.div>
         </div>
 
@@ -122,6 +122,39 @@ export function UserProfilePage() {
     fetchUserProfile()
   }, [userId, navigate])
 
+  // A new account's seller profile is generated in the background after
+  // registration; poll until it is ready, then reload the profile.
+  useEffect(() => {
+    const targetUserId = userId || localStorage.getItem('userId')
+    if (!userData || userData.sellerProfile || !targetUserId) return
+
+    let cancelled = false
+    let timer: ReturnType<typeof setTimeout> | undefined
+    const poll = async () => {
+      try {
+        const response = await fetch(`${API_BASE_URL}/api/users/${targetUserId}/profile-status`)
+        if (!response.ok || cancelled) return
+        const { status } = await response.json()
+        if (status === 'queued' || status === 'running') {
+          timer = setTimeout(poll, 2000)
+        } else if (status === 'ready') {
+          const profileResponse = await fetch(`${API_BASE_URL}/api/users/${targetUserId}/profile`)
+          if (profileResponse.ok && !cancelled) {
+            const data = await profileResponse.json()
+            setUserData(data.user)
+          }
+        }
+      } catch {
+        // Status polling is best effort; the page still works without it.
+      }
+    }
+    poll()
+    return () => {
+      cancelled = true
+      if (timer) clearTimeout(timer)
+    }
+  }, [userData, userId])
+
   if (loading) {
     return (
       <div className="container mx-auto px-4 py-8 max-w-5xl flex items-center justify-center min-h-[400px]">
@@ -36,4 +36,33 @@ router.post("/api/parse-profile", async (req: Request, res: Response) => {
   }
 });
 
+// Parses several profiles in one round trip. Each item succeeds or fails on
+// its own; results come back in request order.
+const MAX_BATCH_ITEMS = 32;
+
+router.post("/api/parse-profile/batch", async (req: Request, res: Response) => {
+  const { items } = req.body;
+  if (!Array.isArray(items) || items.length === 0) {
+    return res.status(400).json({ error: "Missing 'items' array." });
+  }
+  if (items.length > MAX_BATCH_ITEMS) {
+    return res.status(413).json({ error: `At most ${MAX_BATCH_ITEMS} items per batch.` });
+  }
+
+  const results = await Promise.all(
+    items.map(async (item) => {
+      if (!item?.text || !item?.userId) {
+        return { ok: false, status: 400, error: "Missing 'text' or 'userId'." };
+      }
+      try {
+        return { ok: true, data: await parseSellerProfile(item.text, item.userId) };
+      } catch (error) {
+        console.error("Batch profile error:", error);
+        return { ok: false, status: 500, error: "Failed to parse profile." };
+      }
+    }),
+  );
+  res.status(200).json({ results });
+});
+
 export default router;